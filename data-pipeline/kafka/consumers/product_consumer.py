@@ -50,7 +50,12 @@ class DeduplicationService:
         source = event.get("source", "unknown")
         product_id = event.get("source_product_id") or event.get("product_id", "")
         title = event.get("title", "")
-        price = event.get("sale_price") or event.get("original_price", "")
+        price = (
+            event.get("sale_price_cents")
+            or event.get("sale_price")
+            or event.get("original_price_cents")
+            or event.get("original_price", "")
+        )
 
         fingerprint = f"{source}:{product_id}:{title}:{price}"
         return fingerprint
@@ -228,8 +233,8 @@ class ProductConsumer:
         brand = self._extract_brand(title)
 
         # Parse prices
-        original_price = self._parse_price(event.get("original_price"))
-        sale_price = self._parse_price(event.get("sale_price"))
+        original_price = self._event_price(event, "original_price")
+        sale_price = self._event_price(event, "sale_price")
 
         # Calculate discount
         discount_pct = None
@@ -292,8 +297,17 @@ class ProductConsumer:
                 return brand
         return None
 
+    def _event_price(self, event: Dict[str, Any], key: str) -> Optional[float]:
+        """Dollar price for ``key``, read from ``<key>_cents`` when present"""
+        # product_event_v1 carries integer cents in the *_cents fields; the
+        # plain fields are dollar amounts (e.g. from the Node.js producer)
+        cents = event.get(f"{key}_cents")
+        if isinstance(cents, int) and not isinstance(cents, bool):
+            return cents / 100 if cents else None
+        return self._parse_price(event.get(key))
+
     def _parse_price(self, price_val) -> Optional[float]:
-        """Parse price value to float"""
+        """Parse a dollar price value to float"""
         if not price_val:
             return None
         if isinstance(price_val, (int, float)):
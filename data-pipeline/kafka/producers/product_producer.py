@@ -9,7 +9,7 @@ import os
 import time
 import uuid
 from datetime import datetime
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
 from typing import Dict, List, Optional, Any
 
 from confluent_kafka import Producer, KafkaError
@@ -210,10 +210,13 @@ class ProductProducer:
             if key in event and isinstance(event[key], datetime):
                 event[key] = int(event[key].timestamp() * 1000)
 
-        # Convert Decimal to string for Avro
+        # Prices travel as integer cents in the *_cents fields; the plain
+        # fields are dollar amounts and are converted here
         for key in ["original_price", "sale_price"]:
-            if key in event and isinstance(event[key], Decimal):
-                event[key] = str(event[key])
+            if key in event:
+                dollars = event.pop(key)
+                if event.get(f"{key}_cents") is None:
+                    event[f"{key}_cents"] = self._to_cents(dollars)
 
         # Ensure raw_attributes is a dict of strings
         if "raw_attributes" not in event:
@@ -221,6 +224,24 @@ class ProductProducer:
 
         return event
 
+    @staticmethod
+    def _to_cents(price: Any) -> Optional[int]:
+        """
+        Convert a dollar amount (Decimal, int, float or str) to integer cents.
+
+        Returns None for missing or unparseable prices such as "", "N/A" or
+        "Call for price".
+        """
+        if price is None or isinstance(price, bool):
+            return None
+        try:
+            amount = Decimal(str(price).replace("$", "").replace(",", "").strip())
+        except InvalidOperation:
+            return None
+        if not amount.is_finite():
+            return None
+        return int((amount * 100).to_integral_value(rounding=ROUND_HALF_UP))
+
     def _validate_event(self, event: Dict[str, Any]) -> None:
         """Validate event data before production"""
         required_fields = ["event_id", "source", "title", "scraped_at"]
@@ -3,15 +3,63 @@ Product Data Models for SkateStock Data Pipeline
 Pydantic models with type hints for product data validation
 """
 
+import os
+import sys
+import threading
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Optional, List, Dict, Any
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Iterator
 from pydantic import BaseModel, Field, validator
 import uuid
 
+from schemas.avro_schemas import AvroSchemaRegistry
 
-class ProductCategory(str, Enum):
+if sys.version_info >= (3, 11):
+    from enum import StrEnum
+else:
+
+    class StrEnum(str, Enum):
+        """Fallback for Python < 3.11 without per-member instance dicts"""
+
+        __slots__ = ()
+
+
+# Event IDs are sliced from one bulk os.urandom read instead of one syscall
+# per uuid.uuid4() call
+_UUID_POOL_SIZE = 4096
+_uuid_lock = threading.Lock()
+
+
+def _uuid4_hex_pool() -> Iterator[str]:
+    while True:
+        buf = os.urandom(16 * _UUID_POOL_SIZE)
+        for i in range(0, len(buf), 16):
+            yield uuid.UUID(bytes=buf[i : i + 16], version=4).hex
+
+
+_uuid4_hex = _uuid4_hex_pool()
+
+
+def _reset_uuid_pool() -> None:
+    # A forked child must not replay the parent's buffered IDs
+    global _uuid4_hex, _uuid_lock
+    _uuid4_hex = _uuid4_hex_pool()
+    _uuid_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_uuid_pool)
+
+
+def new_event_id() -> str:
+    """Random UUID4 as a 32-char hex string (no hyphens)"""
+    with _uuid_lock:
+        return next(_uuid4_hex)
+
+
+class ProductCategory(StrEnum):
     """Skateboarding product categories"""
 
     DECKS = "decks"
@@ -24,6 +72,22 @@ class ProductCategory(str, Enum):
     ACCESSORIES = "accessories"
     UNKNOWN = "unknown"
 
+    @classmethod
+    def _missing_(cls, value):
+        # Scrapers emit dirty categories; map them to UNKNOWN instead of
+        # raising. Only strings reach the memoized normalizer, so unhashable
+        # junk (lists, dicts) can't break the cache lookup.
+        if isinstance(value, str):
+            return _category_for(value)
+        return cls.UNKNOWN
+
+
+@lru_cache(maxsize=1024)
+def _category_for(value: str) -> ProductCategory:
+    """Case/whitespace-insensitive category lookup, UNKNOWN if unrecognized."""
+    member = ProductCategory._value2member_map_.get(value.strip().lower())
+    return member if member is not None else ProductCategory.UNKNOWN
+
 
 class ProductBrand(str, Enum):
     """Major skateboarding brands"""
@@ -51,7 +115,7 @@ class ProductBrand(str, Enum):
     UNKNOWN = "Unknown"
 
 
-class ShopSource(str, Enum):
+class ShopSource(StrEnum):
     """Data source shops"""
 
     SEASONS = "seasons_skateshop"
@@ -115,7 +179,7 @@ class RawProductEvent(BaseModel):
     Used as Kafka message schema
     """
 
-    event_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    event_id: str = Field(default_factory=new_event_id)
     event_timestamp: datetime = Field(default_factory=datetime.utcnow)
     source: ShopSource
     raw_data: Dict[str, Any]
@@ -212,41 +276,6 @@ class AvailabilityForecast(BaseModel):
     features_used: Dict[str, Any]
 
 
-# Avro Schema Definitions for Kafka
-PRODUCT_EVENT_AVRO_SCHEMA = {
-    "type": "record",
-    "name": "ProductEvent",
-    "namespace": "com.skatestock.events",
-    "fields": [
-        {"name": "event_id", "type": "string"},
-        {"name": "event_timestamp", "type": "string"},
-        {"name": "source", "type": "string"},
-        {"name": "product_id", "type": "string"},
-        {"name": "title", "type": "string"},
-        {"name": "brand", "type": ["null", "string"], "default": None},
-        {"name": "category", "type": "string"},
-        {"name": "original_price", "type": ["null", "string"], "default": None},
-        {"name": "sale_price", "type": ["null", "string"], "default": None},
-        {"name": "currency", "type": "string", "default": "USD"},
-        {"name": "image_url", "type": ["null", "string"], "default": None},
-        {"name": "product_url", "type": "string"},
-        {"name": "availability", "type": "string", "default": "unknown"},
-        {"name": "scraped_at", "type": "string"},
-        {"name": "confidence_score", "type": "double", "default": 1.0},
-    ],
-}
-
-DEAD_LETTER_EVENT_AVRO_SCHEMA = {
-    "type": "record",
-    "name": "DeadLetterEvent",
-    "namespace": "com.skatestock.errors",
-    "fields": [
-        {"name": "event_id", "type": "string"},
-        {"name": "original_event", "type": "string"},
-        {"name": "error_message", "type": "string"},
-        {"name": "error_type", "type": "string"},
-        {"name": "failed_at", "type": "string"},
-        {"name": "retry_count", "type": "int", "default": 0},
-        {"name": "source", "type": "string"},
-    ],
-}
+# Avro Schema Definitions for Kafka (single source: AvroSchemaRegistry)
+PRODUCT_EVENT_AVRO_SCHEMA = AvroSchemaRegistry.EVENTS_PRODUCT_EVENT_V1
+DEAD_LETTER_EVENT_AVRO_SCHEMA = AvroSchemaRegistry.ERRORS_DEAD_LETTER_V1
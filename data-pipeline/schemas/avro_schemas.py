@@ -4,6 +4,7 @@ Ensures data consistency and enables schema evolution
 """
 
 import json
+from functools import cache
 from typing import Dict, Any
 
 
@@ -39,16 +40,16 @@ class AvroSchemaRegistry:
             {"name": "brand", "type": ["null", "string"], "default": None},
             {"name": "category", "type": "string", "default": "unknown"},
             {
-                "name": "original_price",
-                "type": ["null", "string"],
+                "name": "original_price_cents",
+                "type": ["null", "int"],
                 "default": None,
-                "doc": "Original/MSRP price as string to preserve precision",
+                "doc": "Original/MSRP price in cents",
             },
             {
-                "name": "sale_price",
-                "type": ["null", "string"],
+                "name": "sale_price_cents",
+                "type": ["null", "int"],
                 "default": None,
-                "doc": "Current sale price as string",
+                "doc": "Current sale price in cents",
             },
             {"name": "currency", "type": "string", "default": "USD"},
             {
@@ -73,6 +74,26 @@ class AvroSchemaRegistry:
                 "type": {"type": "map", "values": "string"},
                 "default": {},
             },
+            {"name": "confidence_score", "type": "double", "default": 1.0},
+        ],
+    }
+
+    PRODUCT_RAW_V1 = {
+        "type": "record",
+        "name": "ProductRaw",
+        "namespace": "com.skatestock.data",
+        "doc": "Raw product data before validation",
+        "fields": [
+            {"name": "event_id", "type": "string"},
+            {"name": "shop_id", "type": "string"},
+            {"name": "shop_name", "type": "string"},
+            {
+                "name": "raw_data",
+                "type": "string",
+                "doc": "JSON string of raw product data",
+            },
+            {"name": "scraped_at", "type": "long", "logicalType": "timestamp-millis"},
+            {"name": "scraper_name", "type": "string"},
         ],
     }
 
@@ -208,24 +229,266 @@ class AvroSchemaRegistry:
         ],
     }
 
+    INVENTORY_UPDATE_V1 = {
+        "type": "record",
+        "name": "InventoryUpdate",
+        "namespace": "com.skatestock.data",
+        "doc": "Schema for inventory/stock change events",
+        "fields": [
+            {"name": "event_id", "type": "string"},
+            {"name": "product_id", "type": "string"},
+            {"name": "shop_id", "type": "string"},
+            {"name": "external_id", "type": "string"},
+            {"name": "previous_stock_status", "type": "string"},
+            {"name": "new_stock_status", "type": "string"},
+            {"name": "previous_quantity", "type": ["null", "int"]},
+            {"name": "new_quantity", "type": ["null", "int"]},
+            {"name": "is_restock", "type": "boolean", "default": False},
+            {"name": "is_low_stock", "type": "boolean", "default": False},
+            {"name": "updated_at", "type": "long", "logicalType": "timestamp-millis"},
+        ],
+    }
+
+    ALERT_V1 = {
+        "type": "record",
+        "name": "Alert",
+        "namespace": "com.skatestock.data",
+        "doc": "Schema for alert notifications",
+        "fields": [
+            {"name": "alert_id", "type": "string"},
+            {
+                "name": "alert_type",
+                "type": "string",
+                "doc": "price_drop, restock, low_stock, new_product",
+            },
+            {"name": "severity", "type": "string", "doc": "low, medium, high"},
+            {"name": "product_id", "type": "string"},
+            {"name": "shop_id", "type": "string"},
+            {"name": "title", "type": "string", "doc": "Alert title"},
+            {"name": "message", "type": "string", "doc": "Alert message"},
+            {
+                "name": "data",
+                "type": {"type": "map", "values": "string"},
+                "default": {},
+            },
+            {"name": "created_at", "type": "long", "logicalType": "timestamp-millis"},
+        ],
+    }
+
+    # Published com.skatestock.data contracts from kafka/schemas (nested product
+    # record, integer-cents price updates). These are distinct wire formats from
+    # the flat schemas above, not older copies of them.
+    DATA_PRODUCT_EVENT_V1 = {
+        "type": "record",
+        "name": "ProductEvent",
+        "namespace": "com.skatestock.data",
+        "doc": "Schema for product events from scrapers",
+        "fields": [
+            {"name": "event_id", "type": "string", "doc": "Unique event UUID"},
+            {
+                "name": "event_type",
+                "type": "string",
+                "doc": "Event type: created, updated, deleted",
+            },
+            {
+                "name": "event_timestamp",
+                "type": "long",
+                "logicalType": "timestamp-millis",
+                "doc": "Event timestamp in milliseconds",
+            },
+            {"name": "shop_id", "type": "string", "doc": "Shop identifier"},
+            {"name": "shop_name", "type": "string", "doc": "Human-readable shop name"},
+            {
+                "name": "product",
+                "type": {
+                    "type": "record",
+                    "name": "Product",
+                    "fields": [
+                        {
+                            "name": "external_id",
+                            "type": "string",
+                            "doc": "Original ID from shop",
+                        },
+                        {"name": "title", "type": "string", "doc": "Product title"},
+                        {
+                            "name": "description",
+                            "type": ["null", "string"],
+                            "default": None,
+                        },
+                        {"name": "sku", "type": ["null", "string"], "default": None},
+                        {"name": "product_url", "type": "string", "doc": "Product URL"},
+                        {
+                            "name": "image_url",
+                            "type": ["null", "string"],
+                            "default": None,
+                        },
+                        {
+                            "name": "category",
+                            "type": ["null", "string"],
+                            "default": None,
+                        },
+                        {"name": "brand", "type": ["null", "string"], "default": None},
+                        {
+                            "name": "original_price_cents",
+                            "type": ["null", "int"],
+                            "default": None,
+                        },
+                        {
+                            "name": "sale_price_cents",
+                            "type": "int",
+                            "doc": "Current sale price in cents",
+                        },
+                        {"name": "currency_code", "type": "string", "default": "USD"},
+                        {"name": "in_stock", "type": "boolean", "default": True},
+                        {
+                            "name": "stock_quantity",
+                            "type": ["null", "int"],
+                            "default": None,
+                        },
+                        {
+                            "name": "attributes",
+                            "type": {"type": "map", "values": "string"},
+                            "default": {},
+                        },
+                    ],
+                },
+            },
+            {"name": "scraped_at", "type": "long", "logicalType": "timestamp-millis"},
+            {"name": "scraper_version", "type": "string", "default": "1.0.0"},
+        ],
+    }
+
+    DATA_PRICE_UPDATE_V1 = {
+        "type": "record",
+        "name": "PriceUpdate",
+        "namespace": "com.skatestock.data",
+        "doc": "Schema for price change events",
+        "fields": [
+            {"name": "event_id", "type": "string"},
+            {"name": "product_id", "type": "string"},
+            {"name": "shop_id", "type": "string"},
+            {"name": "external_id", "type": "string"},
+            {"name": "previous_price_cents", "type": ["null", "int"]},
+            {"name": "new_price_cents", "type": "int"},
+            {"name": "previous_original_cents", "type": ["null", "int"]},
+            {"name": "new_original_cents", "type": ["null", "int"]},
+            {"name": "price_change_cents", "type": "int"},
+            {"name": "price_change_percent", "type": "float"},
+            {"name": "is_sale", "type": "boolean"},
+            {"name": "discount_percent", "type": ["null", "float"]},
+            {"name": "updated_at", "type": "long", "logicalType": "timestamp-millis"},
+        ],
+    }
+
+    DATA_DEAD_LETTER_V1 = {
+        "type": "record",
+        "name": "DeadLetterEvent",
+        "namespace": "com.skatestock.data",
+        "doc": "Schema for failed events",
+        "fields": [
+            {"name": "original_event_id", "type": "string"},
+            {"name": "original_topic", "type": "string"},
+            {"name": "error_reason", "type": "string"},
+            {"name": "error_message", "type": "string"},
+            {"name": "failed_at", "type": "long", "logicalType": "timestamp-millis"},
+            {"name": "retry_count", "type": "int", "default": 0},
+            {
+                "name": "original_payload",
+                "type": "string",
+                "doc": "JSON string of original event",
+            },
+        ],
+    }
+
+    # Published com.skatestock.events / com.skatestock.errors contracts from
+    # models/product.py (flat record with string timestamps and a product_id)
+    EVENTS_PRODUCT_EVENT_V1 = {
+        "type": "record",
+        "name": "ProductEvent",
+        "namespace": "com.skatestock.events",
+        "fields": [
+            {"name": "event_id", "type": "string"},
+            {"name": "event_timestamp", "type": "string"},
+            {"name": "source", "type": "string"},
+            {"name": "product_id", "type": "string"},
+            {"name": "title", "type": "string"},
+            {"name": "brand", "type": ["null", "string"], "default": None},
+            {"name": "category", "type": "string"},
+            {
+                "name": "original_price",
+                "type": ["null", "int"],
+                "default": None,
+                "doc": "Original/MSRP price in cents",
+            },
+            {
+                "name": "sale_price",
+                "type": ["null", "int"],
+                "default": None,
+                "doc": "Current sale price in cents",
+            },
+            {"name": "currency", "type": "string", "default": "USD"},
+            {"name": "image_url", "type": ["null", "string"], "default": None},
+            {"name": "product_url", "type": "string"},
+            {"name": "availability", "type": "string", "default": "unknown"},
+            {"name": "scraped_at", "type": "string"},
+            {"name": "confidence_score", "type": "double", "default": 1.0},
+        ],
+    }
+
+    ERRORS_DEAD_LETTER_V1 = {
+        "type": "record",
+        "name": "DeadLetterEvent",
+        "namespace": "com.skatestock.errors",
+        "fields": [
+            {"name": "event_id", "type": "string"},
+            {"name": "original_event", "type": "string"},
+            {"name": "error_message", "type": "string"},
+            {"name": "error_type", "type": "string"},
+            {"name": "failed_at", "type": "string"},
+            {"name": "retry_count", "type": "int", "default": 0},
+            {"name": "source", "type": "string"},
+        ],
+    }
+
+    # Schema lookups are cached process-wide: every module resolves its
+    # schemas through this registry, so parsing/serialization happens once.
     @classmethod
+    @cache
     def get_schema(cls, schema_name: str) -> Dict[str, Any]:
         """Get a schema by name"""
         schemas = {
             "product_event_v1": cls.PRODUCT_EVENT_V1,
+            "product_raw_v1": cls.PRODUCT_RAW_V1,
             "normalized_product_v1": cls.NORMALIZED_PRODUCT_V1,
             "dead_letter_v1": cls.DEAD_LETTER_EVENT_V1,
             "price_update_v1": cls.PRICE_UPDATE_V1,
+            "inventory_update_v1": cls.INVENTORY_UPDATE_V1,
+            "alert_v1": cls.ALERT_V1,
             "analytics_metric_v1": cls.ANALYTICS_METRIC_V1,
+            "data_product_event_v1": cls.DATA_PRODUCT_EVENT_V1,
+            "data_price_update_v1": cls.DATA_PRICE_UPDATE_V1,
+            "data_dead_letter_v1": cls.DATA_DEAD_LETTER_V1,
+            "events_product_event_v1": cls.EVENTS_PRODUCT_EVENT_V1,
+            "errors_dead_letter_v1": cls.ERRORS_DEAD_LETTER_V1,
         }
         return schemas.get(schema_name)
 
     @classmethod
+    @cache
     def get_schema_json(cls, schema_name: str) -> str:
         """Get a schema as JSON string"""
         schema = cls.get_schema(schema_name)
         return json.dumps(schema) if schema else None
 
+    @classmethod
+    @cache
+    def get_parsed_schema(cls, schema_name: str) -> Dict[str, Any]:
+        """Get a schema parsed by fastavro, ready for reader/writer use"""
+        from fastavro import parse_schema
+
+        schema = cls.get_schema(schema_name)
+        return parse_schema(schema) if schema else None
+
 
 # Topic configurations with partitioning strategy
 TOPIC_CONFIGURATIONS = {
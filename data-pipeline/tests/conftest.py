@@ -0,0 +1,6 @@
+"""Put data-pipeline on sys.path so tests import modules the way the services do"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,44 @@
+"""Tests for the Avro schema registry and the kafka topic-style aliases"""
+
+from kafka.schemas import avro_schemas as kafka_schemas
+from schemas.avro_schemas import AvroSchemaRegistry
+
+
+def _field_names(schema):
+    return {field["name"] for field in schema["fields"]}
+
+
+def test_kafka_aliases_load_the_data_pipeline_registry():
+    assert kafka_schemas.AvroSchemaRegistry is AvroSchemaRegistry
+
+
+def test_kafka_product_event_keeps_nested_data_contract():
+    schema = kafka_schemas.get_schema("product-event")
+    assert schema is kafka_schemas.PRODUCT_EVENT_SCHEMA
+    assert schema["namespace"] == "com.skatestock.data"
+    product = next(f for f in schema["fields"] if f["name"] == "product")["type"]
+    assert {"original_price_cents", "sale_price_cents"} <= _field_names(product)
+
+
+def test_product_event_v1_prices_are_named_in_cents():
+    fields = _field_names(AvroSchemaRegistry.get_schema("product_event_v1"))
+    assert {"original_price_cents", "sale_price_cents"} <= fields
+    assert not {"original_price", "sale_price"} & fields
+
+
+def test_model_schemas_keep_their_published_contracts():
+    from models.product import (
+        DEAD_LETTER_EVENT_AVRO_SCHEMA,
+        PRODUCT_EVENT_AVRO_SCHEMA,
+    )
+
+    assert PRODUCT_EVENT_AVRO_SCHEMA is AvroSchemaRegistry.get_schema(
+        "events_product_event_v1"
+    )
+    assert PRODUCT_EVENT_AVRO_SCHEMA["namespace"] == "com.skatestock.events"
+    assert "product_id" in _field_names(PRODUCT_EVENT_AVRO_SCHEMA)
+    fields = DEAD_LETTER_EVENT_AVRO_SCHEMA["fields"]
+    dead_letter = {field["name"]: field["type"] for field in fields}
+    assert dead_letter["original_event"] == "string"
+    assert dead_letter["failed_at"] == "string"
+    assert "source" in dead_letter
@@ -0,0 +1,48 @@
+"""Tests for the product enums and helpers in models.product"""
+
+import os
+import uuid
+
+import pytest
+
+from models import product
+from models.product import ProductCategory, new_event_id
+
+
+@pytest.mark.parametrize("raw", ["decks", "Decks", "  DECKS "])
+def test_category_normalizes_case_and_whitespace(raw):
+    assert ProductCategory(raw) is ProductCategory.DECKS
+
+
+@pytest.mark.parametrize("raw", ["skate tools", "", 3, None, ["decks"], {"a": 1}])
+def test_unrecognized_category_maps_to_unknown(raw):
+    assert ProductCategory(raw) is ProductCategory.UNKNOWN
+
+
+def test_new_event_id_is_uuid4_hex():
+    event_id = new_event_id()
+    parsed = uuid.UUID(hex=event_id)
+    assert len(event_id) == 32 and parsed.hex == event_id
+    assert parsed.version == 4 and parsed.variant == uuid.RFC_4122
+
+
+def test_new_event_id_unique_across_pool_refills():
+    ids = [new_event_id() for _ in range(product._UUID_POOL_SIZE * 2 + 1)]
+    assert len(set(ids)) == len(ids)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_does_not_replay_parent_ids():
+    new_event_id()  # make sure the parent has a partly consumed buffer
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        os.write(write_fd, new_event_id().encode())
+        os._exit(0)
+    os.close(write_fd)
+    child_id = os.read(read_fd, 64).decode()
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+    assert len(child_id) == 32
+    assert child_id != new_event_id()
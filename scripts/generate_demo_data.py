@@ -3,7 +3,7 @@
 SkateStock Demo Data Generator
 Generates high-fidelity mock data for 5 distinct retailer personalities
 
-Requirements: pip install psycopg2-binary tqdm python-dotenv
+Requirements: pip install numpy psycopg2-binary tqdm python-dotenv
 
 Examples:
     # Generate 5000 products and seed via API
@@ -23,32 +23,58 @@ Examples:
 """
 
 import argparse
+import asyncio
+import csv
+import heapq
+import io
 import json
 import os
+import queue
 import random
 import re
 import sys
+import threading
+from bisect import bisect_left
+from collections import defaultdict, deque
+from concurrent.futures import (
+    FIRST_EXCEPTION,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import List, Dict, Any, Optional, Tuple
+from itertools import groupby, islice
+from operator import attrgetter
+from typing import List, Dict, Any, BinaryIO, Iterable, Iterator, Optional, Sequence, TextIO, Tuple, Union
 import uuid
 
+import numpy as np
+
 # Optional imports - fail gracefully if not available
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     HAS_REQUESTS = True
 except ImportError:
     HAS_REQUESTS = False
     requests = None
+    HTTPAdapter = None
+    Retry = None
 
 try:
     import psycopg2
-    from psycopg2.extras import execute_values
+    from psycopg2.extras import execute_batch
+    from psycopg2.pool import ThreadedConnectionPool
     HAS_PSYCOPG2 = True
 except ImportError:
     HAS_PSYCOPG2 = False
     psycopg2 = None
-    execute_values = None
+    execute_batch = None
+    ThreadedConnectionPool = None
 
 try:
     from tqdm import tqdm
@@ -57,6 +83,24 @@ except ImportError:
     HAS_TQDM = False
     tqdm = None
 
+try:
+    import asyncpg
+    HAS_ASYNCPG = True
+except ImportError:
+    HAS_ASYNCPG = False
+    asyncpg = None
+
+try:
+    import orjson
+    HAS_ORJSON = True
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+    _dumps = json.dumps
+
 try:
     from dotenv import load_dotenv
     load_dotenv()
@@ -197,6 +241,17 @@ SKATE_PRODUCTS = {
     ],
 }
 
+# Structure-of-arrays view of the catalog for vectorized sampling
+_SKATE_ARRAYS = {
+    category: {
+        "names": np.array([item[0] for item in items], dtype=object),
+        "brands": np.array([item[1] for item in items], dtype=object),
+        "base": np.array([item[2] for item in items], dtype=np.float32),
+        "msrp": np.array([item[3] for item in items], dtype=np.float32),
+    }
+    for category, items in SKATE_PRODUCTS.items()
+}
+
 # Retailer personalities
 RETAILER_PERSONALITIES = {
     "seasons_skateshop": {
@@ -269,19 +324,142 @@ CATEGORY_MAP = {
     "apparel": "apparel",
 }
 
+# Variant options per category; None means "no variant"
+_COLORS = {
+    "decks": ("Black", "White", "Natural", "Blue", "Red", "Green", "Yellow", "Purple", None),
+    "trucks": ("Silver", "Black", "Raw", "Gold", "Blue", "Red", None),
+    "wheels": ("White", "Black", "Red", "Blue", "Green", "Orange", "Clear", "Swirl", None),
+    "bearings": (None,),  # Bearings don't have colors usually
+    "hardware": ("Black", "Silver", "Gold", "Rainbow", "Blue", "Red", None),
+    "grip_tape": ("Black", "Clear", "Graphic", "Neon", None),
+    "wax": ("White", "Pink", "Blue", "Green", "Yellow", "Orange", None),
+    "shoes": ("Black/White", "Black/Black", "White/White", "Navy/White", "Grey/Black",
+              "Red/White", "Brown/Gum", "Olive/Black", None),
+    "apparel": ("Black", "White", "Grey", "Navy", "Red", "Green", "Yellow", "Pink", None),
+}
+
+_SIZES = {
+    "decks": ("7.75", "7.875", "8.0", "8.125", "8.25", "8.375", "8.5", "8.75", "9.0"),
+    "trucks": ("129 (7.6-7.9)", "139 (8.0-8.2)", "144 (8.25)", "149 (8.5)", "159 (8.75-9.0)"),
+    "wheels": ("50mm", "51mm", "52mm", "53mm", "54mm", "55mm", "56mm", "58mm", "60mm"),
+    "bearings": (None,),
+    "hardware": ("7/8\"", "1\"", "1 1/8\"", "1 1/4\""),
+    "grip_tape": ("9\" x 33\"", "10\" x 33\"", "9\" x 36\""),
+    "wax": ("Small", "Medium", "Large"),
+    "shoes": ("7", "7.5", "8", "8.5", "9", "9.5", "10", "10.5", "11", "11.5", "12", "13"),
+    "apparel": ("XS", "S", "M", "L", "XL", "XXL"),
+}
+
+# Brands flagged as skater-owned when seeding the brands table
+_SKATER_OWNED_BRANDS = frozenset({
+    "Baker", "Independent", "Spitfire", "Thrasher", "Anti-Hero",
+    "Thunder", "Bones", "Bronson", "Andale", "Modus",
+    "Mob", "Jessup", "Shake Junt", "Black Diamond",
+    "Shortys", "Skate Mental", "Diamond",
+})
+
+# Frozen iteration orders, hoisted out of the per-day loops
+_CATEGORIES = tuple(SKATE_PRODUCTS)
+_RETAILERS = tuple(RETAILER_PERSONALITIES.items())
+
+# Interned copies of the short strings repeated on every product row
+_INTERNED = {
+    k: sys.intern(k)
+    for k in (*CATEGORY_MAP, "USD", "in_stock", "out_of_stock", "low_stock", "pre_order")
+}
+
+# Tags attached to every generated pipeline metric
+_METRIC_TAGS = _dumps({"source": "generator"})
+
+# Availability labels indexed by 0=in stock, 1=low stock, 2=out of stock
+_AVAILABILITY_LABELS = np.array(
+    [_INTERNED["in_stock"], _INTERNED["low_stock"], _INTERNED["out_of_stock"]], dtype=object
+)
+
+
+# ============================================================================
+# IDS
+# ============================================================================
+
+def _batch_uuids(n: int) -> List[str]:
+    """Generate ``n`` random UUID4 strings from a single os.urandom read."""
+    buf = os.urandom(16 * n)
+    return [str(uuid.UUID(bytes=buf[i:i + 16], version=4)) for i in range(0, 16 * n, 16)]
+
+
+def _iter_uuids(batch_size: int = 4096) -> Iterator[str]:
+    """Endless stream of UUID4 strings, refilled ``batch_size`` at a time."""
+    while True:
+        yield from _batch_uuids(batch_size)
+
+
+# ============================================================================
+# TIMESTAMPS
+# ============================================================================
+
+def _utc_timestamps(epoch_ms: Iterable[int], count: int = -1) -> List[str]:
+    """
+    Format epoch-millisecond timestamps as ISO-8601 UTC strings ("...Z").
+
+    Every export path (COPY, asyncpg, SQL file, price history) uses this one
+    formatter, so the same dataset loads the same timestamps however it is
+    ingested.
+    """
+    return np.datetime_as_string(
+        np.fromiter(epoch_ms, dtype=np.int64, count=count).astype("datetime64[ms]"),
+        timezone="UTC",
+    ).tolist()
+
+
+# ============================================================================
+# PRODUCT RECORD
+# ============================================================================
+
+@dataclass(slots=True)
+class Product:
+    """A generated product event; fixed-layout so large datasets stay compact."""
+
+    event_id: str
+    event_timestamp: int
+    source: str
+    source_product_id: str
+    title: str
+    brand: Optional[str]
+    category: str
+    original_price_cents: int
+    sale_price_cents: int
+    currency: str
+    discount_percentage: Optional[float]
+    image_url: str
+    product_url: str
+    availability: str
+    stock_quantity: int
+    color: Optional[str]
+    size: Optional[str]
+    scraped_at: int
+    raw_attributes: Dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict form for JSON output, the API and DataValidator."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 # ============================================================================
 # DATABASE CONNECTION
 # ============================================================================
 
+def get_db_url(db_url: Optional[str] = None) -> str:
+    """Get connection string from args, environment, or default."""
+    return db_url or os.getenv("DATABASE_URL") or "postgresql://localhost:5432/skatestock"
+
+
 def get_db_connection(db_url: Optional[str] = None):
     """Get a PostgreSQL database connection."""
     if not HAS_PSYCOPG2:
         raise ImportError("psycopg2-binary is required for database operations. "
                          "Install with: pip install psycopg2-binary")
     
-    # Get connection string from args, environment, or default
-    conn_str = db_url or os.getenv("DATABASE_URL") or "postgresql://localhost:5432/skatestock"
+    conn_str = get_db_url(db_url)
     
     try:
         conn = psycopg2.connect(conn_str)
@@ -300,38 +478,91 @@ def get_db_connection(db_url: Optional[str] = None):
 class DataValidator:
     """Validates generated product data against schema constraints."""
     
-    REQUIRED_FIELDS = ["event_id", "source", "title", "sale_price", "category"]
-    VALID_CATEGORIES = list(SKATE_PRODUCTS.keys())
-    VALID_AVAILABILITY = ["in_stock", "out_of_stock", "low_stock", "pre_order"]
+    REQUIRED_FIELDS = ("event_id", "source", "title", "sale_price_cents", "category")
+    MAX_SALE_PRICE_CENTS = 1_000_000
+    VALID_CATEGORIES = frozenset(SKATE_PRODUCTS)
+    VALID_AVAILABILITY = frozenset(("in_stock", "out_of_stock", "low_stock", "pre_order"))
+    # Fields read by the fast check, required ones first; the getter is built once
+    _CHECKED_FIELDS = REQUIRED_FIELDS + ("original_price_cents", "discount_percentage", "availability")
+    _checked_values = attrgetter(*_CHECKED_FIELDS)
     
     @classmethod
-    def validate_product(cls, product: Dict[str, Any]) -> Tuple[bool, List[str]]:
+    def validate_product(cls, product: Union[Product, Dict[str, Any]]) -> Tuple[bool, Sequence[str]]:
         """Validate a single product. Returns (is_valid, list of errors)."""
+        # Error messages are only built for products that fail the fast check
+        if cls._is_valid(product):
+            return True, ()
+        errors = cls._collect_errors(product)
+        return len(errors) == 0, errors
+    
+    @classmethod
+    def _is_valid(cls, product: Union[Product, Dict[str, Any]]) -> bool:
+        """Fast check without building error messages; False means "run the full validation"."""
+        if isinstance(product, dict):
+            values = tuple(map(product.get, cls._CHECKED_FIELDS))
+        else:
+            values = cls._checked_values(product)
+        for value in values[:len(cls.REQUIRED_FIELDS)]:
+            if value is None:
+                return False
+        sale_price, category, orig_price, discount, availability = values[3:]
+        
+        try:
+            if not isinstance(sale_price, (int, float)):
+                sale_price = float(sale_price)
+            if not 0 <= sale_price <= cls.MAX_SALE_PRICE_CENTS:
+                return False
+            
+            if orig_price:
+                if not isinstance(orig_price, (int, float)):
+                    orig_price = float(orig_price)
+                if orig_price < 0:
+                    return False
+            
+            if discount is not None:
+                if not isinstance(discount, (int, float)):
+                    discount = float(discount)
+                if not 0 <= discount <= 100:
+                    return False
+        except (ValueError, TypeError):
+            return False
+        
+        if category and category not in cls.VALID_CATEGORIES:
+            return False
+        if availability and availability not in cls.VALID_AVAILABILITY:
+            return False
+        return True
+    
+    @classmethod
+    def _collect_errors(cls, product: Union[Product, Dict[str, Any]]) -> List[str]:
+        """Full validation pass that describes every problem found."""
+        if not isinstance(product, dict):
+            product = product.to_dict()
         errors = []
         
         # Check required fields
-        for field in cls.REQUIRED_FIELDS:
-            if field not in product or product[field] is None:
-                errors.append(f"Missing required field: {field}")
+        for name in cls.REQUIRED_FIELDS:
+            if name not in product or product[name] is None:
+                errors.append(f"Missing required field: {name}")
         
         # Validate price ranges
         try:
-            sale_price = float(product.get("sale_price", 0))
+            sale_price = float(product.get("sale_price_cents", 0))
             if sale_price < 0:
-                errors.append(f"Invalid sale_price: {sale_price} (must be >= 0)")
-            if sale_price > 10000:
-                errors.append(f"Suspicious sale_price: {sale_price} (seems too high)")
+                errors.append(f"Invalid sale_price_cents: {sale_price} (must be >= 0)")
+            if sale_price > cls.MAX_SALE_PRICE_CENTS:
+                errors.append(f"Suspicious sale_price_cents: {sale_price} (seems too high)")
         except (ValueError, TypeError):
-            errors.append(f"Invalid sale_price format: {product.get('sale_price')}")
+            errors.append(f"Invalid sale_price_cents format: {product.get('sale_price_cents')}")
         
-        # Validate original_price if present
-        if product.get("original_price"):
+        # Validate original_price_cents if present
+        if product.get("original_price_cents"):
             try:
-                orig_price = float(product["original_price"])
+                orig_price = float(product["original_price_cents"])
                 if orig_price < 0:
-                    errors.append(f"Invalid original_price: {orig_price}")
+                    errors.append(f"Invalid original_price_cents: {orig_price}")
             except (ValueError, TypeError):
-                errors.append(f"Invalid original_price format: {product['original_price']}")
+                errors.append(f"Invalid original_price_cents format: {product['original_price_cents']}")
         
         # Validate category
         if product.get("category") and product["category"] not in cls.VALID_CATEGORIES:
@@ -351,146 +582,220 @@ class DataValidator:
             except (ValueError, TypeError):
                 errors.append(f"Invalid discount_percentage format: {discount}")
         
-        return len(errors) == 0, errors
+        return errors
     
     @classmethod
-    def validate_products(cls, products: List[Dict[str, Any]]) -> Tuple[int, List[str]]:
+    def validate_products(cls, products: Iterable[Union[Product, Dict[str, Any]]]) -> Tuple[int, List[str]]:
         """Validate multiple products. Returns (valid_count, all_errors)."""
         all_errors = []
         valid_count = 0
+        is_valid = cls._is_valid
+        collect_errors = cls._collect_errors
         
         for i, product in enumerate(products):
-            is_valid, errors = cls.validate_product(product)
-            if is_valid:
+            if is_valid(product):
+                valid_count += 1
+                continue
+            errors = collect_errors(product)
+            if not errors:
                 valid_count += 1
             else:
                 for error in errors:
                     all_errors.append(f"Product {i}: {error}")
         
         return valid_count, all_errors
+    
+    @classmethod
+    def iter_validated(
+        cls, products: Iterable[Product], report: Dict[str, Any]
+    ) -> Iterator[Product]:
+        """
+        Yield products unchanged, validating them as they pass.
+
+        Results accumulate in ``report`` as ``valid`` (count) and ``errors``
+        (messages), matching validate_products.
+        """
+        is_valid = cls._is_valid
+        collect_errors = cls._collect_errors
+        all_errors = report.setdefault("errors", [])
+        report.setdefault("valid", 0)
+        
+        for i, product in enumerate(products):
+            errors = () if is_valid(product) else collect_errors(product)
+            if errors:
+                all_errors.extend(f"Product {i}: {error}" for error in errors)
+            else:
+                report["valid"] += 1
+            yield product
 
 
 # ============================================================================
 # RETAILER SIMULATOR
 # ============================================================================
 
+def _draw_variants(
+    table: Dict[str, Tuple[Optional[str], ...]],
+    categories: Sequence[str],
+    per_category: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Draw ``per_category`` options from ``table`` for each category block."""
+    blocks = []
+    for category in categories:
+        options = np.array(table.get(category, (None,)), dtype=object)
+        blocks.append(options[rng.integers(0, len(options), per_category)])
+    return np.concatenate(blocks)
+
+
 class RetailerSimulator:
     """Simulates product data for a specific retailer personality"""
 
     def __init__(self, retailer_id: str, personality: Dict[str, Any], seed: int = None):
-        self.retailer_id = retailer_id
+        self.retailer_id = sys.intern(retailer_id)
         self.personality = personality
-        self.rng = random.Random(seed)
-
-    def generate_product(
-        self, category: str, base_product: tuple, timestamp: datetime
-    ) -> Dict[str, Any]:
-        """Generate a single product with retailer-specific variations"""
-        name, brand, base_price, msrp = base_product
-
-        # Apply retailer personality
-        discount_freq = self.personality["discount_frequency"]
-        discount_range = self.personality["discount_depth"]
-        stockout_rate = self.personality["stockout_rate"]
-        volatility = self.personality["price_volatility"]
-
-        # Decide if this product is on sale
-        is_on_sale = self.rng.random() < discount_freq
-
-        if is_on_sale:
-            discount_pct = self.rng.uniform(*discount_range)
-            sale_price = round(base_price * (1 - discount_pct), 2)
-        else:
-            sale_price = base_price
-            discount_pct = 0
+        self.rng = np.random.default_rng(seed)
+        self._source_id_prefix = f"{self.retailer_id}_"
+        self._image_base = "https://example.com/images/"
+        self._product_base = f"https://{retailer_id.replace('_', '')}.com/products/"
+
+    def generate_products(
+        self, current_date: datetime, products_per_category: int
+    ) -> List[Product]:
+        """
+        Generate one day of products across all categories.
 
-        # Add price volatility (random fluctuation)
-        sale_price = round(
-            sale_price * (1 + self.rng.uniform(-volatility, volatility)), 2
+        All random draws are made as NumPy arrays in one pass per day; Product
+        records are only built at the end, sorted by event_timestamp.
+        """
+        categories = _CATEGORIES
+        n = products_per_category * len(categories)
+        if n == 0:
+            return []
+
+        rng = self.rng
+        personality = self.personality
+        volatility = personality["price_volatility"]
+
+        # Pick products per category, fancy-indexing every catalog column at once
+        picks = [
+            (arrays, rng.integers(0, len(arrays["names"]), products_per_category))
+            for arrays in (_SKATE_ARRAYS[category] for category in categories)
+        ]
+        category_col = np.repeat(
+            np.array([_INTERNED[c] for c in categories], dtype=object), products_per_category
+        )
+        names = np.concatenate([arrays["names"][i] for arrays, i in picks])
+        brands = np.concatenate([arrays["brands"][i] for arrays, i in picks])
+        base_prices = np.concatenate([arrays["base"][i] for arrays, i in picks])
+        msrp_cents = np.rint(
+            np.concatenate([arrays["msrp"][i] for arrays, i in picks]) * 100
+        ).astype(np.int64)
+
+        # Decide which products are on sale, then apply price volatility
+        is_on_sale = rng.random(n) < personality["discount_frequency"]
+        discount_pcts = np.where(
+            is_on_sale, rng.uniform(*personality["discount_depth"], n), 0.0
         )
+        sale_price_cents = np.rint(
+            base_prices
+            * (1 - discount_pcts)
+            * (1 + rng.uniform(-volatility, volatility, n))
+            * 100
+        ).astype(np.int64)
+        discounts = np.round(discount_pcts * 100, 2)
 
         # Determine availability
-        availability = "in_stock"
-        stock_qty = self.rng.randint(1, 50)
-        if self.rng.random() < stockout_rate:
-            availability = "out_of_stock"
-            stock_qty = 0
-        elif self.rng.random() < 0.3:
-            availability = "low_stock"
-            stock_qty = self.rng.randint(1, 5)
-
-        # Data quality issues for certain retailers
-        if self.personality["data_quality"] == "low":
-            # Random typos, missing fields
-            if self.rng.random() < 0.1:
-                name = name.replace("e", "3", 1)  # Leet speak typo
-            if self.rng.random() < 0.05:
-                brand = None  # Missing brand
-
-        # Generate variant info
-        color = self._generate_color(category)
-        size = self._generate_size(category)
-        
-        # Add variant info to name if applicable
-        if color and self.rng.random() < 0.3:
-            name = f"{name} - {color}"
-        if size and self.rng.random() < 0.3:
-            name = f"{name} ({size})"
-
-        product = {
-            "event_id": str(uuid.uuid4()),
-            "event_timestamp": int(timestamp.timestamp() * 1000),
-            "source": self.retailer_id,
-            "source_product_id": f"{self.retailer_id}_{self.rng.randint(10000, 99999)}",
-            "title": name,
-            "brand": brand,
-            "category": category,
-            "original_price": str(msrp),
-            "sale_price": str(sale_price),
-            "currency": "USD",
-            "discount_percentage": round(discount_pct * 100, 2) if is_on_sale else None,
-            "image_url": f"https://example.com/images/{self.rng.randint(1000, 9999)}.jpg",
-            "product_url": f"https://{self.retailer_id.replace('_', '')}.com/products/{self.rng.randint(1000, 9999)}",
-            "availability": availability,
-            "stock_quantity": stock_qty,
-            "color": color,
-            "size": size,
-            "scraped_at": int(timestamp.timestamp() * 1000),
-            "raw_attributes": {},
-        }
-
-        return product
-    
-    def _generate_color(self, category: str) -> Optional[str]:
-        """Generate realistic colors based on category."""
-        colors = {
-            "decks": ["Black", "White", "Natural", "Blue", "Red", "Green", "Yellow", "Purple", None],
-            "trucks": ["Silver", "Black", "Raw", "Gold", "Blue", "Red", None],
-            "wheels": ["White", "Black", "Red", "Blue", "Green", "Orange", "Clear", "Swirl", None],
-            "bearings": [None],  # Bearings don't have colors usually
-            "hardware": ["Black", "Silver", "Gold", "Rainbow", "Blue", "Red", None],
-            "grip_tape": ["Black", "Clear", "Graphic", "Neon", None],
-            "wax": ["White", "Pink", "Blue", "Green", "Yellow", "Orange", None],
-            "shoes": ["Black/White", "Black/Black", "White/White", "Navy/White", "Grey/Black", 
-                     "Red/White", "Brown/Gum", "Olive/Black", None],
-            "apparel": ["Black", "White", "Grey", "Navy", "Red", "Green", "Yellow", "Pink", None],
-        }
-        return self.rng.choice(colors.get(category, [None]))
-    
-    def _generate_size(self, category: str) -> Optional[str]:
-        """Generate realistic sizes based on category."""
-        sizes = {
-            "decks": ["7.75", "7.875", "8.0", "8.125", "8.25", "8.375", "8.5", "8.75", "9.0"],
-            "trucks": ["129 (7.6-7.9)", "139 (8.0-8.2)", "144 (8.25)", "149 (8.5)", "159 (8.75-9.0)"],
-            "wheels": ["50mm", "51mm", "52mm", "53mm", "54mm", "55mm", "56mm", "58mm", "60mm"],
-            "bearings": [None],
-            "hardware": ["7/8\"", "1\"", "1 1/8\"", "1 1/4\""],
-            "grip_tape": ["9\" x 33\"", "10\" x 33\"", "9\" x 36\""],
-            "wax": ["Small", "Medium", "Large"],
-            "shoes": ["7", "7.5", "8", "8.5", "9", "9.5", "10", "10.5", "11", "11.5", "12", "13"],
-            "apparel": ["XS", "S", "M", "L", "XL", "XXL"],
-        }
-        return self.rng.choice(sizes.get(category, [None]))
+        stock_qty = rng.integers(1, 51, n)
+        out_of_stock = rng.random(n) < personality["stockout_rate"]
+        low_stock = ~out_of_stock & (rng.random(n) < 0.3)
+        stock_qty[out_of_stock] = 0
+        stock_qty[low_stock] = rng.integers(1, 6, int(low_stock.sum()))
+        availability = _AVAILABILITY_LABELS[np.where(out_of_stock, 2, low_stock.astype(np.intp))]
+
+        # Event times as millisecond offsets from local midnight
+        day_base_ms = int(
+            current_date.replace(hour=0, minute=0, second=0, microsecond=0).timestamp() * 1000
+        )
+        timestamps_ms = day_base_ms + rng.integers(0, 86_400_000, n)
+        colors = _draw_variants(_COLORS, categories, products_per_category, rng)
+        sizes = _draw_variants(_SIZES, categories, products_per_category, rng)
+        color_name_draws = rng.random(n)
+        size_name_draws = rng.random(n)
+
+        # Ids are independent draws, so the formatted columns need no reordering
+        source_prefix = self._source_id_prefix
+        image_base = self._image_base
+        product_base = self._product_base
+        source_product_ids = [f"{source_prefix}{i}" for i in rng.integers(10000, 100000, n).tolist()]
+        image_urls = [f"{image_base}{i}.jpg" for i in rng.integers(1000, 10000, n).tolist()]
+        product_urls = [f"{product_base}{i}" for i in rng.integers(1000, 10000, n).tolist()]
+
+        # Data quality issues for certain retailers: random typos, missing fields
+        if personality["data_quality"] == "low":
+            typo_mask = rng.random(n) < 0.1
+            names[typo_mask] = [
+                name.replace("e", "3", 1)  # Leet speak typo
+                for name in names[typo_mask]
+            ]
+            brands[rng.random(n) < 0.05] = None  # Missing brand
+
+        event_ids = _batch_uuids(n)
+        products = []
+
+        # Emit rows in timestamp order so callers can merge instead of sort
+        order = np.argsort(timestamps_ms, kind="stable")
+
+        # .tolist() hands back native Python scalars for the per-row pass
+        for (
+            event_id, source_product_id, image_url, product_url,
+            category, name, brand, msrp, sale_cents, on_sale, discount,
+            avail, qty, timestamp_ms, color, size,
+            color_name_draw, size_name_draw,
+        ) in zip(event_ids, source_product_ids, image_urls, product_urls, *(arr[order].tolist() for arr in (
+            category_col, names, brands, msrp_cents, sale_price_cents, is_on_sale, discounts, availability, stock_qty,
+            timestamps_ms, colors, sizes,
+            color_name_draws, size_name_draws,
+        ))):
+            # Add variant info to name if applicable
+            if color and color_name_draw < 0.3:
+                name = f"{name} - {color}"
+            if size and size_name_draw < 0.3:
+                name = f"{name} ({size})"
+
+            products.append(Product(
+                event_id=event_id,
+                event_timestamp=timestamp_ms,
+                source=self.retailer_id,
+                source_product_id=source_product_id,
+                title=name,
+                brand=brand,
+                category=category,
+                original_price_cents=msrp,
+                sale_price_cents=sale_cents,
+                currency=_INTERNED["USD"],
+                discount_percentage=discount if on_sale else None,
+                image_url=image_url,
+                product_url=product_url,
+                availability=avail,
+                stock_quantity=qty,
+                color=color,
+                size=size,
+                scraped_at=timestamp_ms,
+            ))
+
+        return products
+
+
+def _gen_retailer_day(
+    retailer_id: str,
+    personality: Dict[str, Any],
+    seed: int,
+    current_date: datetime,
+    products_per_category: int,
+) -> List[Product]:
+    """Generate one retailer's products for one day (process pool entry point)."""
+    simulator = RetailerSimulator(retailer_id, personality, seed=seed)
+    return simulator.generate_products(current_date, products_per_category)
 
 
 # ============================================================================
@@ -500,10 +805,12 @@ class RetailerSimulator:
 class DemoDataGenerator:
     """Main class for generating demo data."""
     
-    def __init__(self, seed: int = 42, chaos_mode: bool = False):
+    def __init__(self, seed: int = 42, chaos_mode: bool = False, workers: int = 1):
         self.rng = random.Random(seed)
+        self.np_rng = np.random.default_rng(seed)
         self.chaos_mode = chaos_mode
         self.seed = seed
+        self.workers = max(1, workers)
         self.stats = {
             "total_products": 0,
             "total_price_history": 0,
@@ -516,204 +823,284 @@ class DemoDataGenerator:
         self,
         days: int = 7,
         products_per_day: int = 800,
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Product]:
         """Generate complete demo dataset across all retailers."""
-        all_products = []
-        base_date = datetime.now() - timedelta(days=days)
+        return list(self.iter_products(days=days, products_per_day=products_per_day))
 
-        # Create simulators for each retailer
-        simulators = {
-            rid: RetailerSimulator(rid, personality, seed=self.seed + i)
-            for i, (rid, personality) in enumerate(RETAILER_PERSONALITIES.items())
-        }
+    def iter_products(
+        self,
+        days: int = 7,
+        products_per_day: int = 800,
+    ) -> Iterator[Product]:
+        """
+        Lazily generate the demo dataset in timestamp order, one day at a time.
+
+        Only a single day of products is held in memory, so the result can be
+        streamed straight into a database insert or file writer.
+        """
+        base_date = datetime.now() - timedelta(days=days)
 
-        products_per_retailer = products_per_day // len(RETAILER_PERSONALITIES)
-        total_iterations = days * len(RETAILER_PERSONALITIES)
+        products_per_retailer = products_per_day // len(_RETAILERS)
+        products_per_category = products_per_retailer // len(_CATEGORIES)
+        day_batches = self._iter_day_batches(base_date, days, products_per_category)
         
         # Progress bar wrapper
-        progress_iter = tqdm(range(days), desc="Generating products") if HAS_TQDM else range(days)
-
-        for day in progress_iter:
-            current_date = base_date + timedelta(days=day)
-
-            for retailer_id, simulator in simulators.items():
-                # Generate products for this retailer on this day
-                daily_products = []
-
-                # Distribute across categories
-                categories = list(SKATE_PRODUCTS.keys())
-                products_per_category = products_per_retailer // len(categories)
-
-                for category in categories:
-                    category_products = SKATE_PRODUCTS[category]
+        progress_iter = (
+            tqdm(day_batches, total=days, desc="Generating products") if HAS_TQDM else day_batches
+        )
 
-                    for _ in range(products_per_category):
-                        # Pick a random product from this category
-                        base_product = self.rng.choice(category_products)
+        # Chaos duplicates can spill past midnight; carry them into the next day
+        carry_over = []
 
-                        # Generate timestamp throughout the day
-                        hour = self.rng.randint(0, 23)
-                        minute = self.rng.randint(0, 59)
-                        timestamp = current_date.replace(hour=hour, minute=minute)
+        by_timestamp = attrgetter("event_timestamp")
+        chaos_mode = self.chaos_mode
+        chaos_draw = self.rng.random
 
-                        product = simulator.generate_product(
-                            category, base_product, timestamp
-                        )
-                        daily_products.append(product)
+        for day, retailer_batches in enumerate(progress_iter):
+            current_date = base_date + timedelta(days=day)
+            # Every batch below is already in timestamp order
+            batches = [carry_over]
 
+            for daily_products in retailer_batches:
                 # Chaos mode: add duplicates
-                if self.chaos_mode and self.rng.random() < 0.2:
+                if chaos_mode and chaos_draw() < 0.2:
                     # Duplicate 5% of products
                     duplicates = self.rng.sample(daily_products, len(daily_products) // 20)
-                    for dup in duplicates:
-                        dup_copy = dup.copy()
-                        dup_copy["event_id"] = str(uuid.uuid4())
-                        dup_copy["event_timestamp"] += self.rng.randint(1000, 60000)
-                        daily_products.append(dup_copy)
+                    dup_ids = _batch_uuids(len(duplicates))
+                    dup_copies = []
+                    for dup, dup_id in zip(duplicates, dup_ids):
+                        dup_copies.append(replace(
+                            dup,
+                            event_id=dup_id,
+                            event_timestamp=dup.event_timestamp + self.rng.randint(1000, 60000),
+                        ))
+                    dup_copies.sort(key=by_timestamp)
+                    batches.append(dup_copies)
+
+                batches.append(daily_products)
+
+            # Merge the sorted batches, holding back anything that belongs to tomorrow
+            day_products = list(heapq.merge(*batches, key=by_timestamp))
+            next_day_ms = int(
+                (current_date + timedelta(days=1))
+                .replace(hour=0, minute=0, second=0, microsecond=0)
+                .timestamp() * 1000
+            )
+            split = bisect_left(day_products, next_day_ms, key=by_timestamp)
+            carry_over = day_products[split:]
+            del day_products[split:]
 
-                all_products.extend(daily_products)
+            yield from self._count_products(day_products)
 
-        # Sort by timestamp
-        all_products.sort(key=lambda x: x["event_timestamp"])
-        
-        # Update stats
-        self.stats["total_products"] = len(all_products)
-        for p in all_products:
-            shop = p["source"]
-            cat = p["category"]
-            self.stats["by_shop"][shop] = self.stats["by_shop"].get(shop, 0) + 1
-            self.stats["by_category"][cat] = self.stats["by_category"].get(cat, 0) + 1
+        yield from self._count_products(carry_over)
 
-        return all_products
+    def _iter_day_batches(
+        self,
+        base_date: datetime,
+        days: int,
+        products_per_category: int,
+    ) -> Iterator[List[List[Product]]]:
+        """
+        Yield each day's per-retailer product batches, in day order.
+
+        Every (day, retailer) pair gets its own seed (``seed + day * 997 +
+        retailer index``), so the output is the same whether the batches are
+        generated in-process or across worker processes.
+        """
+        def day_tasks(day: int) -> List[Tuple]:
+            current_date = base_date + timedelta(days=day)
+            return [
+                (rid, personality, self.seed + day * 997 + idx, current_date, products_per_category)
+                for idx, (rid, personality) in enumerate(_RETAILERS)
+            ]
+
+        if self.workers == 1:
+            for day in range(days):
+                yield [_gen_retailer_day(*task) for task in day_tasks(day)]
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            # Bound the days in flight so products still stream out day by day
+            pending = deque()
+            for day in range(days):
+                pending.append([executor.submit(_gen_retailer_day, *task) for task in day_tasks(day)])
+                if len(pending) > self.workers:
+                    yield [future.result() for future in pending.popleft()]
+            while pending:
+                yield [future.result() for future in pending.popleft()]
+
+    def _count_products(self, products: List[Product]) -> Iterator[Product]:
+        """Update generation stats as products are handed out."""
+        by_shop = self.stats["by_shop"]
+        by_category = self.stats["by_category"]
+        for p in products:
+            shop = p.source
+            cat = p.category
+            by_shop[shop] = by_shop.get(shop, 0) + 1
+            by_category[cat] = by_category.get(cat, 0) + 1
+            self.stats["total_products"] += 1
+            yield p
     
     def generate_price_history(
         self,
-        products: List[Dict[str, Any]],
+        products: List[Product],
         days: int = 30,
     ) -> List[Dict[str, Any]]:
-        """Generate price history for each product."""
-        price_history = []
+        """
+        Generate price history for each product.
+
+        The bounded random walk is stepped one day at a time across all
+        products as NumPy arrays, so the Python-level work is only the final
+        record assembly.
+        """
         base_date = datetime.now() - timedelta(days=days)
+        ids = _iter_uuids()
+        
+        # Get base prices, skipping products without a usable price
+        priced = [p for p in products if p.sale_price_cents is not None]
+        
+        if not priced or days <= 0:
+            self.stats["total_price_history"] = 0
+            return []
+        
+        base = np.fromiter((p.sale_price_cents for p in priced), dtype=np.float64, count=len(priced)) / 100
+        lower, upper = base * 0.5, base * 1.5
+        
+        # Random walk with constraints (±10% change max), kept within
+        # reasonable bounds (50% - 150% of base)
+        changes = self.np_rng.uniform(-0.10, 0.10, size=(len(priced), days))
+        walks = np.empty_like(changes)
+        current = base
+        for day in range(days):
+            current = np.round(np.clip(np.round(current * (1 + changes[:, day]), 2), lower, upper), 2)
+            walks[:, day] = current
+        sale_cents = np.rint(walks * 100).astype(np.int64).tolist()
+        
+        # Determine event types
+        event_types = np.where(
+            changes < -0.05, "sale_started", np.where(changes > 0.05, "sale_ended", "price_check")
+        )
+        event_types[:, 0] = "price_check"
+        event_types = event_types.tolist()
+        
+        dates = _utc_timestamps(
+            int((base_date + timedelta(days=day)).timestamp() * 1000) for day in range(days)
+        )
         
         progress_desc = f"Generating {days} days of price history"
-        product_iter = tqdm(products, desc=progress_desc) if HAS_TQDM else products
+        product_iter = tqdm(priced, desc=progress_desc) if HAS_TQDM else priced
         
-        for product in product_iter:
-            # Get base price
-            try:
-                base_price = float(product["sale_price"])
-            except (ValueError, TypeError):
-                continue
-            
-            current_price = base_price
-            product_id = product.get("event_id", str(uuid.uuid4()))
+        # Every product gets exactly one record per day, so size the list up front
+        price_history = [None] * (len(priced) * days)
+        
+        for start, product, product_cents, product_events in zip(
+            range(0, len(price_history), days), product_iter, sale_cents, event_types
+        ):
+            product_id = product.event_id or next(ids)
+            original_price_cents = product.original_price_cents
+            in_stock = product.availability == "in_stock"
             
-            # Generate daily price points
-            for day in range(days):
-                date = base_date + timedelta(days=day)
-                
-                # Random walk with constraints (±10% change max)
-                change_pct = self.rng.uniform(-0.10, 0.10)
-                current_price = round(current_price * (1 + change_pct), 2)
-                
-                # Keep within reasonable bounds (50% - 150% of base)
-                current_price = max(base_price * 0.5, min(base_price * 1.5, current_price))
-                current_price = round(current_price, 2)
-                
-                # Determine event type
-                if day == 0:
-                    event_type = "price_check"
-                elif change_pct < -0.05:
-                    event_type = "sale_started"
-                elif change_pct > 0.05:
-                    event_type = "sale_ended"
-                else:
-                    event_type = "price_check"
-                
-                history_record = {
-                    "id": str(uuid.uuid4()),
+            price_history[start:start + days] = [
+                {
+                    "id": next(ids),
                     "product_event_id": product_id,
-                    "original_price_cents": int(float(product["original_price"]) * 100) if product.get("original_price") else None,
-                    "sale_price_cents": int(current_price * 100),
-                    "in_stock": product.get("availability") == "in_stock",
-                    "recorded_at": date.isoformat(),
+                    "original_price_cents": original_price_cents,
+                    "sale_price_cents": cents,
+                    "in_stock": in_stock,
+                    "recorded_at": date,
                     "event_type": event_type,
                 }
-                price_history.append(history_record)
+                for cents, date, event_type in zip(product_cents, dates, product_events)
+            ]
         
         self.stats["total_price_history"] = len(price_history)
         return price_history
     
     def generate_analytics_data(
         self,
-        products: List[Dict[str, Any]],
+        products: List[Product],
         days: int = 30,
     ) -> Dict[str, List[Dict[str, Any]]]:
         """Generate analytics data for price trends and discount patterns."""
-        analytics = {
-            "price_trends": [],
-            "discount_patterns": [],
-            "metrics": [],
+        return {
+            "price_trends": list(self.iter_price_trends(products, days)),
+            "discount_patterns": list(self.iter_discount_patterns(products)),
+            "metrics": list(self.iter_metrics(days)),
         }
-        
+    
+    def iter_price_trends(
+        self,
+        products: List[Product],
+        days: int = 30,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield price trend rows per category per day.
+
+        The price statistics do not change from day to day, so they are
+        computed once per category.
+        """
         base_date = datetime.now() - timedelta(days=days)
+        ids = _iter_uuids()
         
         # Group products by category
-        by_category = {}
+        by_category = defaultdict(list)
         for p in products:
-            cat = p["category"]
-            if cat not in by_category:
-                by_category[cat] = []
-            by_category[cat].append(p)
+            by_category[p.category].append(p)
+        by_category = dict(by_category)
         
-        # Generate price trends per category per day
         for category, cat_products in by_category.items():
-            for day in range(days):
+            prices = np.fromiter(
+                (p.sale_price_cents for p in cat_products if p.sale_price_cents),
+                dtype=np.float64,
+            )
+            if not prices.size:
+                continue
+            
+            avg_price = float(prices.mean())
+            avg_price_cents = int(avg_price)
+            min_price_cents = int(prices.min())
+            max_price_cents = int(prices.max())
+            
+            # Calculate volatility (std dev, in dollars)
+            volatility = round(float(prices.std()) / 100, 4)
+            
+            # Determine trend direction (mock logic): compare against a
+            # "previous day" average whose relative noise matches jittering
+            # every price by U(-5%, 5%)
+            noise_sd = 0.05 / np.sqrt(3) * np.sqrt(np.square(prices).sum()) / prices.sum()
+            prev_avgs = avg_price * (1 + self.np_rng.normal(0, noise_sd, days))
+            trends = np.where(
+                avg_price > prev_avgs * 1.02,
+                "rising",
+                np.where(avg_price < prev_avgs * 0.98, "falling", "stable"),
+            )
+            trends[:1] = "stable"
+            
+            for day, trend in enumerate(trends.tolist()):
                 date = base_date + timedelta(days=day)
-                prices = [float(p["sale_price"]) for p in cat_products 
-                         if p.get("sale_price")]
-                
-                if prices:
-                    avg_price = sum(prices) / len(prices)
-                    min_price = min(prices)
-                    max_price = max(prices)
-                    
-                    # Calculate volatility (std dev)
-                    variance = sum((p - avg_price) ** 2 for p in prices) / len(prices)
-                    volatility = variance ** 0.5
-                    
-                    # Determine trend direction (mock logic)
-                    if day > 0:
-                        prev_day_prices = [p * (1 + self.rng.uniform(-0.05, 0.05)) for p in prices]
-                        prev_avg = sum(prev_day_prices) / len(prev_day_prices)
-                        if avg_price > prev_avg * 1.02:
-                            trend = "rising"
-                        elif avg_price < prev_avg * 0.98:
-                            trend = "falling"
-                        else:
-                            trend = "stable"
-                    else:
-                        trend = "stable"
-                    
-                    analytics["price_trends"].append({
-                        "id": str(uuid.uuid4()),
-                        "category": category,
-                        "date": date.date().isoformat(),
-                        "avg_price_cents": int(avg_price * 100),
-                        "min_price_cents": int(min_price * 100),
-                        "max_price_cents": int(max_price * 100),
-                        "price_volatility": round(volatility, 4),
-                        "trend_direction": trend,
-                    })
+                yield {
+                    "id": next(ids),
+                    "category": category,
+                    "date": date.date().isoformat(),
+                    "avg_price_cents": avg_price_cents,
+                    "min_price_cents": min_price_cents,
+                    "max_price_cents": max_price_cents,
+                    "price_volatility": volatility,
+                    "trend_direction": trend,
+                }
+    
+    def iter_discount_patterns(self, products: List[Product]) -> Iterator[Dict[str, Any]]:
+        """Lazily yield discount pattern rows per retailer per category."""
+        ids = _iter_uuids()
+        pattern_types = ("flash_sale", "seasonal", "clearance", "weekend_deal", "member_exclusive")
+        frequencies = ("weekly", "monthly", "quarterly", "daily")
+        # Categories in order of first appearance
+        categories = tuple(dict.fromkeys(p.category for p in products))
         
-        # Generate discount patterns per retailer
-        for retailer_id, personality in RETAILER_PERSONALITIES.items():
-            for category in by_category.keys():
-                pattern_types = ["flash_sale", "seasonal", "clearance", "weekend_deal", "member_exclusive"]
-                frequencies = ["weekly", "monthly", "quarterly", "daily"]
-                
-                analytics["discount_patterns"].append({
-                    "id": str(uuid.uuid4()),
+        for retailer_id, personality in _RETAILERS:
+            for category in categories:
+                yield {
+                    "id": next(ids),
                     "shop_name": retailer_id,
                     "category": category,
                     "pattern_type": self.rng.choice(pattern_types),
@@ -721,9 +1108,12 @@ class DemoDataGenerator:
                     "frequency": self.rng.choice(frequencies),
                     "typical_start_day": self.rng.randint(0, 6),
                     "typical_duration_days": self.rng.randint(1, 7),
-                })
-        
-        # Generate pipeline performance metrics
+                }
+    
+    def iter_metrics(self, days: int = 30) -> Iterator[Dict[str, Any]]:
+        """Lazily yield pipeline performance metric rows per day."""
+        base_date = datetime.now() - timedelta(days=days)
+        ids = _iter_uuids()
         metric_names = [
             ("products_scraped", "count"),
             ("scrape_duration_ms", "ms"),
@@ -742,85 +1132,156 @@ class DemoDataGenerator:
                 else:
                     value = float(self.rng.randint(100, 5000))
                 
-                analytics["metrics"].append({
-                    "id": str(uuid.uuid4()),
+                yield {
+                    "id": next(ids),
                     "metric_name": metric_name,
                     "metric_value": round(value, 4),
                     "unit": unit,
-                    "tags": json.dumps({"source": "generator"}),
+                    "tags": _METRIC_TAGS,
                     "recorded_at": date.isoformat(),
-                })
-        
-        return analytics
+                }
 
 
 # ============================================================================
 # DATABASE OPERATIONS
 # ============================================================================
 
+class _LookupCache(dict):
+    """Dict that fills in missing keys with ``resolve(key)`` on first access."""
+    
+    __slots__ = ("resolve",)
+    
+    def __init__(self, resolve):
+        super().__init__()
+        self.resolve = resolve
+    
+    def __missing__(self, key):
+        value = self[key] = self.resolve(key)
+        return value
+
+
+# Retailer id / product source -> shops.name, normalized once per distinct source
+_SHOP_KEYS = _LookupCache(lambda source: source.replace("_skateshop", "").replace("_store", ""))
+
+
+def _bulk_insert(conn, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> int:
+    """
+    Stream rows into ``table`` with ``COPY ... FROM STDIN``. Returns the row count.
+
+    Rows are written as tab-delimited CSV with ``None`` as ``\\N``. The caller
+    owns the transaction and is responsible for committing.
+    """
+    buf = io.StringIO()
+    writer = csv.writer(buf, delimiter="\t", lineterminator="\n")
+    count = 0
+    for row in rows:
+        writer.writerow([r"\N" if value is None else value for value in row])
+        count += 1
+    
+    buf.seek(0)
+    with conn.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {table} ({', '.join(columns)}) FROM STDIN "
+            r"WITH (FORMAT CSV, DELIMITER E'\t', NULL '\N')",
+            buf,
+        )
+    return count
+
+
 class DatabaseSeeder:
     """Handles database seeding operations."""
     
-    def __init__(self, db_url: Optional[str] = None):
+    def __init__(self, db_url: Optional[str] = None, workers: int = 1):
         self.db_url = db_url
+        self.workers = max(1, workers)
         self.conn = None
+        # With workers > 1, extra connections for concurrent seeding and COPY shards
+        self.pool = None
+        self._prepared = set()
+        self._count_lock = threading.Lock()
         self.rows_inserted = 0
+        # Set while seed_all holds one transaction open on self.conn
+        self._in_outer_txn = False
+    
+    # Seed upserts, prepared once per connection so repeated executions
+    # skip parsing and planning
+    SEED_STATEMENTS = {
+        "ins_shop": """
+            INSERT INTO shops (name, display_name, base_url, location, scrape_frequency_minutes)
+            VALUES ($1, $2, $3, $4, $5)
+            ON CONFLICT (name) DO UPDATE SET
+                display_name = EXCLUDED.display_name,
+                base_url = EXCLUDED.base_url,
+                location = EXCLUDED.location,
+                updated_at = NOW()
+        """,
+        "ins_category": """
+            INSERT INTO categories (name, display_name, sort_order)
+            VALUES ($1, $2, $3)
+            ON CONFLICT (name) DO UPDATE SET
+                display_name = EXCLUDED.display_name,
+                sort_order = EXCLUDED.sort_order
+        """,
+        "ins_brand": """
+            INSERT INTO brands (name, display_name, is_skater_owned)
+            VALUES ($1, $2, $3)
+            ON CONFLICT (name) DO UPDATE SET
+                display_name = EXCLUDED.display_name,
+                is_skater_owned = EXCLUDED.is_skater_owned
+        """,
+    }
     
     def connect(self):
-        """Establish database connection."""
+        """Establish database connection(s) and prepare the seed statements."""
         self.conn = get_db_connection(self.db_url)
+        self._prepare(self.conn)
+        if self.workers > 1:
+            # Enough connections for the three concurrent seeds or every COPY shard
+            self.pool = ThreadedConnectionPool(1, max(self.workers, 3), get_db_url(self.db_url))
         return self
     
     def close(self):
-        """Close database connection."""
+        """Close database connection(s)."""
+        if self.pool:
+            self.pool.closeall()
+            self.pool = None
+            self._prepared.clear()
         if self.conn:
             self.conn.close()
             self.conn = None
     
-    def seed_shops(self) -> int:
+    def _prepare(self, conn) -> None:
+        """PREPARE the seed statements on ``conn`` unless already done."""
+        if conn in self._prepared:
+            return
+        with conn.cursor() as cursor:
+            for name, sql in self.SEED_STATEMENTS.items():
+                cursor.execute(f"PREPARE {name} AS {sql}")
+        conn.commit()
+        self._prepared.add(conn)
+    
+    def seed_shops(self, conn=None) -> int:
         """Seed the shops table. Returns number of shops inserted."""
         if not self.conn:
             raise RuntimeError("Not connected to database")
         
-        cursor = self.conn.cursor()
-        inserted = 0
-        
-        for retailer_id, personality in RETAILER_PERSONALITIES.items():
-            try:
-                cursor.execute("""
-                    INSERT INTO shops (name, display_name, base_url, location, scrape_frequency_minutes)
-                    VALUES (%s, %s, %s, %s, %s)
-                    ON CONFLICT (name) DO UPDATE SET
-                        display_name = EXCLUDED.display_name,
-                        base_url = EXCLUDED.base_url,
-                        location = EXCLUDED.location,
-                        updated_at = NOW()
-                    RETURNING id
-                """, (
-                    retailer_id.replace("_skateshop", "").replace("_store", ""),
-                    personality["display_name"],
-                    personality["base_url"],
-                    personality["location"],
-                    60
-                ))
-                self.conn.commit()
-                inserted += 1
-            except psycopg2.Error as e:
-                print(f"⚠️  Error inserting shop {retailer_id}: {e}")
-                self.conn.rollback()
-        
-        cursor.close()
-        self.rows_inserted += inserted
-        return inserted
+        rows = [
+            (
+                _SHOP_KEYS[retailer_id],
+                personality["display_name"],
+                personality["base_url"],
+                personality["location"],
+                60,
+            )
+            for retailer_id, personality in RETAILER_PERSONALITIES.items()
+        ]
+        return self._upsert_seed_rows("ins_shop", rows, "shop", conn)
     
-    def seed_categories(self) -> int:
+    def seed_categories(self, conn=None) -> int:
         """Seed the categories table. Returns number of categories inserted."""
         if not self.conn:
             raise RuntimeError("Not connected to database")
         
-        cursor = self.conn.cursor()
-        inserted = 0
-        
         category_display = {
             "decks": "Decks",
             "trucks": "Trucks", 
@@ -833,173 +1294,418 @@ class DatabaseSeeder:
             "apparel": "Apparel",
         }
         
-        for i, (cat_key, display_name) in enumerate(category_display.items()):
-            try:
-                cursor.execute("""
-                    INSERT INTO categories (name, display_name, sort_order)
-                    VALUES (%s, %s, %s)
-                    ON CONFLICT (name) DO UPDATE SET
-                        display_name = EXCLUDED.display_name,
-                        sort_order = EXCLUDED.sort_order
-                    RETURNING id
-                """, (cat_key, display_name, i + 1))
-                self.conn.commit()
-                inserted += 1
-            except psycopg2.Error as e:
-                print(f"⚠️  Error inserting category {cat_key}: {e}")
-                self.conn.rollback()
-        
-        cursor.close()
-        self.rows_inserted += inserted
-        return inserted
+        rows = [
+            (cat_key, display_name, i + 1)
+            for i, (cat_key, display_name) in enumerate(category_display.items())
+        ]
+        return self._upsert_seed_rows("ins_category", rows, "category", conn)
     
-    def seed_brands(self) -> int:
+    def seed_brands(self, conn=None) -> int:
         """Seed the brands table with brands from products."""
         if not self.conn:
             raise RuntimeError("Not connected to database")
         
-        cursor = self.conn.cursor()
-        inserted = 0
-        
         # Extract unique brands from products
-        brands = set()
-        for category_products in SKATE_PRODUCTS.values():
-            for _, brand, _, _ in category_products:
-                if brand:
-                    brands.add(brand)
+        brands = {brand for items in SKATE_PRODUCTS.values() for _, brand, _, _ in items if brand}
         
-        skater_owned_brands = {
-            "Baker", "Independent", "Spitfire", "Thrasher", "Anti-Hero",
-            "Thunder", "Bones", "Bronson", "Andale", "Modus",
-            "Mob", "Jessup", "Shake Junt", "Black Diamond",
-            "Shortys", "Skate Mental", "Diamond",
-        }
+        rows = [(brand.lower(), brand, brand in _SKATER_OWNED_BRANDS) for brand in brands]
+        return self._upsert_seed_rows("ins_brand", rows, "brand", conn)
+    
+    def seed_lookup_tables(self) -> int:
+        """
+        Seed shops, categories and brands. Returns number of rows inserted.
+
+        With a connection pool the three tables are seeded concurrently, each
+        on its own connection and committed independently; otherwise they run
+        in order on ``self.conn``.
+        """
+        if not self.conn:
+            raise RuntimeError("Not connected to database")
+        
+        seeds = (self.seed_shops, self.seed_categories, self.seed_brands)
+        if not self.pool:
+            return sum(seed() for seed in seeds)
         
-        for brand in sorted(brands):
+        def run_seed(seed) -> int:
+            conn = self.pool.getconn()
             try:
-                cursor.execute("""
-                    INSERT INTO brands (name, display_name, is_skater_owned)
-                    VALUES (%s, %s, %s)
-                    ON CONFLICT (name) DO UPDATE SET
-                        display_name = EXCLUDED.display_name,
-                        is_skater_owned = EXCLUDED.is_skater_owned
-                    RETURNING id
-                """, (
-                    brand.lower(),
-                    brand,
-                    brand in skater_owned_brands
-                ))
+                self._prepare(conn)
+                if self._in_outer_txn:
+                    with conn.cursor() as cursor:
+                        cursor.execute("SET LOCAL synchronous_commit = off")
+                return seed(conn)
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                self.pool.putconn(conn)
+        
+        with ThreadPoolExecutor(max_workers=len(seeds)) as executor:
+            futures = [executor.submit(run_seed, seed) for seed in seeds]
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            # Surface the first failure; the rest finish before the pool exits
+            return sum(future.result() for future in done)
+    
+    def seed_all(
+        self,
+        products: Iterable[Product],
+        batch_size: int = 5000,
+        fresh_load: bool = False,
+    ) -> int:
+        """
+        Seed shops, categories, brands and products with synchronous_commit off.
+
+        On a single connection everything runs in one transaction. With
+        ``workers > 1`` the lookup tables are seeded concurrently and committed
+        first so the COPY shard connections can reference them. Returns number
+        of products inserted.
+        """
+        if not self.conn:
+            raise RuntimeError("Not connected to database")
+        
+        self._in_outer_txn = True
+        try:
+            with self.conn.cursor() as cursor:
+                cursor.execute("SET LOCAL synchronous_commit = off")
+            self.seed_lookup_tables()
+            if self.workers > 1:
                 self.conn.commit()
-                inserted += 1
-            except psycopg2.Error as e:
-                print(f"⚠️  Error inserting brand {brand}: {e}")
-                self.conn.rollback()
+            inserted = self.insert_products(products, batch_size=batch_size, fresh_load=fresh_load)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            self._in_outer_txn = False
+        return inserted
+    
+    def _commit(self, conn=None) -> None:
+        """Commit ``conn`` unless it is self.conn inside a seed_all transaction."""
+        conn = conn or self.conn
+        if not (self._in_outer_txn and conn is self.conn):
+            conn.commit()
+    
+    def _upsert_seed_rows(self, statement: str, rows: List[tuple], label: str, conn=None) -> int:
+        """
+        Upsert seed rows through the prepared ``statement`` with a single commit.
+
+        Rows are sent on ``conn`` (default ``self.conn``) with execute_batch,
+        many EXECUTEs per round trip. If the batch fails, fall back to one row
+        per savepoint so a bad row is skipped instead of failing the whole seed.
+        """
+        if not rows:
+            return 0
         
+        conn = conn or self.conn
+        sql = f"EXECUTE {statement} ({', '.join(['%s'] * len(rows[0]))})"
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute("SAVEPOINT seed_rows")
+            execute_batch(cursor, sql, rows, page_size=500)
+            inserted = len(rows)
+        except psycopg2.Error:
+            cursor.execute("ROLLBACK TO SAVEPOINT seed_rows")
+            inserted = 0
+            for row in rows:
+                try:
+                    cursor.execute(sql, row)
+                    cursor.execute("RELEASE SAVEPOINT seed_rows")
+                    inserted += 1
+                except psycopg2.Error as e:
+                    print(f"⚠️  Error inserting {label} {row[0]}: {e}")
+                    cursor.execute("ROLLBACK TO SAVEPOINT seed_rows")
+                cursor.execute("SAVEPOINT seed_rows")
+        
+        cursor.execute("RELEASE SAVEPOINT seed_rows")
+        self._commit(conn)
         cursor.close()
-        self.rows_inserted += inserted
+        with self._count_lock:
+            self.rows_inserted += inserted
         return inserted
     
-    def insert_products(self, products: List[Dict[str, Any]], batch_size: int = 100) -> int:
-        """Insert products directly to database."""
+    # Columns written for each product, in _product_rows order
+    PRODUCT_COLUMNS = (
+        "shop_id", "category_id", "brand_id", "external_id", "title",
+        "product_url", "image_url", "original_price_cents", "sale_price_cents",
+        "in_stock", "stock_quantity", "availability_status", "attributes",
+        "discount_percentage", "last_scraped_at",
+    )
+    
+    PRODUCT_STAGE_SQL = (
+        "CREATE TEMP TABLE products_stage (LIKE products INCLUDING DEFAULTS) ON COMMIT DROP"
+    )
+    
+    # Random external ids and chaos duplicates can repeat within one load;
+    # keep the most recently scraped row for each key
+    PRODUCT_MERGE_SQL = f"""
+        INSERT INTO products ({", ".join(PRODUCT_COLUMNS)})
+        SELECT DISTINCT ON (shop_id, external_id) {", ".join(PRODUCT_COLUMNS)}
+        FROM products_stage
+        ORDER BY shop_id, external_id, last_scraped_at DESC
+        ON CONFLICT (shop_id, external_id) DO UPDATE SET
+            category_id = EXCLUDED.category_id,
+            brand_id = EXCLUDED.brand_id,
+            title = EXCLUDED.title,
+            product_url = EXCLUDED.product_url,
+            image_url = EXCLUDED.image_url,
+            original_price_cents = EXCLUDED.original_price_cents,
+            sale_price_cents = EXCLUDED.sale_price_cents,
+            in_stock = EXCLUDED.in_stock,
+            stock_quantity = EXCLUDED.stock_quantity,
+            availability_status = EXCLUDED.availability_status,
+            attributes = EXCLUDED.attributes,
+            discount_percentage = EXCLUDED.discount_percentage,
+            last_scraped_at = EXCLUDED.last_scraped_at,
+            updated_at = NOW()
+    """
+    
+    # Into a just-truncated table nothing can conflict, so skip the
+    # unique-index conflict handling and EXCLUDED evaluation entirely
+    PRODUCT_LOAD_SQL = f"""
+        INSERT INTO products ({", ".join(PRODUCT_COLUMNS)})
+        SELECT DISTINCT ON (shop_id, external_id) {", ".join(PRODUCT_COLUMNS)}
+        FROM products_stage
+        ORDER BY shop_id, external_id, last_scraped_at DESC
+    """
+    
+    # CASCADE is required while other tables reference products, and it empties
+    # them too: price_history, price_trends, product_fingerprints,
+    # data_quality_issues and alert_history
+    PRODUCT_TRUNCATE_SQL = "TRUNCATE products CASCADE"
+    
+    def insert_products(
+        self,
+        products: Iterable[Product],
+        batch_size: int = 5000,
+        fresh_load: bool = False,
+    ) -> int:
+        """
+        Insert products directly to database.
+
+        Rows are streamed with COPY into a temporary staging table, ``batch_size``
+        rows per COPY, and merged into ``products`` with a single upsert. With
+        ``workers > 1`` the rows are sharded across that many connections.
+        Only a few batches are held in memory at a time, so ``products`` may be
+        any iterable (e.g. ``DemoDataGenerator.iter_products``).
+
+        With ``fresh_load`` the products table (and everything referencing it)
+        is truncated first and rows are merged with a plain INSERT. The
+        truncate and the load run in one transaction on a single connection,
+        so a failed load leaves the existing products in place.
+
+        On a database error the products transaction is rolled back and the
+        error re-raised.
+        """
         if not self.conn:
             raise RuntimeError("Not connected to database")
         
-        cursor = self.conn.cursor()
-        inserted = 0
+        merge_sql = self.PRODUCT_MERGE_SQL
+        parallel = self.workers > 1
+        if fresh_load:
+            with self.conn.cursor() as cursor:
+                cursor.execute(self.PRODUCT_TRUNCATE_SQL)
+            merge_sql = self.PRODUCT_LOAD_SQL
+            # Shard connections would block on the uncommitted TRUNCATE's lock,
+            # so load on this connection and commit both together
+            parallel = False
         
-        # Get shop and category mappings
-        cursor.execute("SELECT id, name FROM shops")
-        shop_map = {name: str(shop_id) for shop_id, name in cursor.fetchall()}
+        shop_map, cat_map, brand_map = self._fetch_lookup_maps()
         
-        cursor.execute("SELECT id, name FROM categories")
-        cat_map = {name: str(cat_id) for cat_id, name in cursor.fetchall()}
-        
-        cursor.execute("SELECT id, name FROM brands")
-        brand_map = {name.lower(): str(brand_id) for brand_id, name in cursor.fetchall()}
+        rows = self._product_rows(products, shop_map, cat_map, brand_map)
+        batches = iter(lambda: list(islice(rows, batch_size)), [])
         
         # Process in batches
-        progress_iter = tqdm(range(0, len(products), batch_size), desc="Inserting products") if HAS_TQDM else range(0, len(products), batch_size)
+        progress_iter = tqdm(batches, desc="Inserting products") if HAS_TQDM else batches
+        
+        try:
+            if parallel:
+                inserted = self._copy_products_parallel(progress_iter, merge_sql)
+            else:
+                inserted = self._copy_products(self.conn, progress_iter, merge_sql)
+        except psycopg2.Error as e:
+            print(f"⚠️  Error inserting products: {e}")
+            self.conn.rollback()
+            raise
         
-        for i in progress_iter:
-            batch = products[i:i + batch_size]
-            values = []
+        self.rows_inserted += inserted
+        return inserted
+    
+    def _fetch_lookup_maps(self) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """
+        Fetch shop, category and brand ids by name in one round trip.
+
+        Rows are streamed through a server-side cursor, so a large brands table
+        is never materialized as one list.
+        """
+        maps = {"s": {}, "c": {}, "b": {}}
+        with self.conn.cursor(name="product_lookups") as cursor:
+            cursor.itersize = 2000
+            cursor.execute("""
+                SELECT 's', id, name FROM shops
+                UNION ALL SELECT 'c', id, name FROM categories
+                UNION ALL SELECT 'b', id, lower(name) FROM brands
+            """)
+            for kind, row_id, name in cursor:
+                maps[kind][name] = row_id
+        return maps["s"], maps["c"], maps["b"]
+    
+    def _copy_products(
+        self, conn, batches: Iterable[List[tuple]], merge_sql: str, commit: bool = True
+    ) -> int:
+        """COPY row batches into a staging table on ``conn`` and merge them with ``merge_sql``."""
+        with conn.cursor() as cursor:
+            if self._in_outer_txn:
+                cursor.execute("SET LOCAL synchronous_commit = off")
+            cursor.execute(self.PRODUCT_STAGE_SQL)
+            for values in batches:
+                _bulk_insert(conn, "products_stage", self.PRODUCT_COLUMNS, values)
             
-            for p in batch:
-                # Map source to shop_id
-                shop_name = p["source"].replace("_skateshop", "").replace("_store", "")
-                shop_id = shop_map.get(shop_name)
-                
+            cursor.execute(merge_sql)
+            inserted = cursor.rowcount
+        if commit:
+            self._commit(conn)
+        return inserted
+    
+    def _copy_products_parallel(self, batches: Iterable[List[tuple]], merge_sql: str) -> int:
+        """
+        Shard row batches by external id and COPY each shard on its own connection.
+
+        Each shard runs on a separate Postgres backend, and rows sharing a
+        (shop_id, external_id) key always land in the same shard, so the merges
+        never contend for a row. Shards only commit once every shard has
+        merged; if any shard fails, all are rolled back and the error is raised.
+        """
+        shards = self.workers
+        key = self.PRODUCT_COLUMNS.index("external_id")
+        # Bounded queues keep at most a couple of batches per shard in memory
+        queues = [queue.Queue(maxsize=2) for _ in range(shards)]
+        pool = self.pool
+        conns = []
+        
+        def run_shard(conn, shard_queue: queue.Queue) -> int:
+            shard_batches = iter(shard_queue.get, None)
+            try:
+                return self._copy_products(conn, shard_batches, merge_sql, commit=False)
+            finally:
+                # Keep draining so the producer never blocks on a failed shard
+                # (a no-op once the None sentinel has been consumed)
+                for _ in shard_batches:
+                    pass
+        
+        try:
+            # Check out every connection before any batch is queued, so a
+            # refused connection fails here rather than stalling the producer
+            for _ in range(shards):
+                conns.append(pool.getconn())
+            
+            with ThreadPoolExecutor(max_workers=shards) as executor:
+                futures = [
+                    executor.submit(run_shard, conn, shard_queue)
+                    for conn, shard_queue in zip(conns, queues)
+                ]
+                try:
+                    for values in batches:
+                        parts = [[] for _ in range(shards)]
+                        for row in values:
+                            parts[hash(row[key]) % shards].append(row)
+                        for shard_queue, part in zip(queues, parts):
+                            if part:
+                                shard_queue.put(part)
+                finally:
+                    for shard_queue in queues:
+                        shard_queue.put(None)
+            
+            # Raises the first shard failure before anything is committed
+            inserted = sum(future.result() for future in futures)
+            for conn in conns:
+                conn.commit()
+            return inserted
+        except BaseException:
+            for conn in conns:
+                try:
+                    conn.rollback()
+                except psycopg2.Error:
+                    pass  # Connection is already gone; nothing left to undo
+            raise
+        finally:
+            for conn in conns:
+                pool.putconn(conn, close=bool(conn.closed))
+    
+    def insert_metrics(self, metrics: Iterable[Dict[str, Any]]) -> int:
+        """Bulk-load generated pipeline metrics into ``performance_metrics``."""
+        if not self.conn:
+            raise RuntimeError("Not connected to database")
+        
+        rows = (
+            (m["metric_name"], m["metric_value"], m["unit"], m["tags"], m["recorded_at"])
+            for m in metrics
+        )
+        try:
+            inserted = _bulk_insert(
+                self.conn,
+                "performance_metrics",
+                ("metric_name", "metric_value", "unit", "tags", "recorded_at"),
+                rows,
+            )
+            self.conn.commit()
+        except psycopg2.Error as e:
+            print(f"⚠️  Error inserting metrics: {e}")
+            self.conn.rollback()
+            inserted = 0
+        
+        self.rows_inserted += inserted
+        return inserted
+    
+    @staticmethod
+    def _product_rows(
+        products: Iterable[Product],
+        shop_map: Dict[str, Any],
+        cat_map: Dict[str, Any],
+        brand_map: Dict[str, Any],
+    ) -> Iterator[tuple]:
+        """Lazily map products to ``products`` table rows, skipping unmappable ones."""
+        # Each distinct source/category/brand is resolved to its id only once
+        shop_ids = _LookupCache(lambda source: shop_map.get(_SHOP_KEYS[source]))
+        cat_ids = _LookupCache(lambda category: cat_map.get(CATEGORY_MAP.get(category, category)))
+        brand_ids = _LookupCache(lambda brand: brand_map.get(brand.lower()) if brand else None)
+        
+        # Identical (color, size) pairs share one serialized attributes blob
+        attributes = _LookupCache(lambda variant: _dumps({"color": variant[0], "size": variant[1]}))
+        
+        products = iter(products)
+        for chunk in iter(lambda: list(islice(products, 4096)), []):
+            # Epoch-ms timestamps are formatted in one vectorized call per chunk
+            scraped_at = _utc_timestamps((p.event_timestamp for p in chunk), len(chunk))
+            
+            for p, last_scraped_at in zip(chunk, scraped_at):
+                shop_id = shop_ids[p.source]
                 if not shop_id:
                     continue
                 
-                # Map category
-                cat_name = CATEGORY_MAP.get(p["category"], p["category"])
-                cat_id = cat_map.get(cat_name)
-                
-                # Map brand
-                brand_name = p.get("brand", "").lower() if p.get("brand") else None
-                brand_id = brand_map.get(brand_name) if brand_name else None
-                
-                try:
-                    original_price_cents = int(float(p.get("original_price", 0)) * 100) if p.get("original_price") else None
-                    sale_price_cents = int(float(p["sale_price"]) * 100)
-                except (ValueError, TypeError):
+                # A NULL or negative price would fail the whole COPY on the
+                # NOT NULL / positive_prices constraints, so drop the row here
+                sale_price_cents = p.sale_price_cents
+                if not isinstance(sale_price_cents, int) or sale_price_cents < 0:
                     continue
                 
-                values.append((
+                yield (
                     shop_id,
-                    cat_id,
-                    brand_id,
-                    p["source_product_id"],
-                    p["title"][:500],  # Truncate to fit VARCHAR(500)
-                    p["product_url"],
-                    p.get("image_url"),
-                    original_price_cents,
+                    cat_ids[p.category],
+                    brand_ids[p.brand],
+                    p.source_product_id,
+                    p.title[:500],  # Truncate to fit VARCHAR(500)
+                    p.product_url,
+                    p.image_url,
+                    p.original_price_cents,
                     sale_price_cents,
-                    p.get("availability") == "in_stock",
-                    p.get("stock_quantity"),
-                    p.get("availability", "unknown"),
-                    json.dumps({"color": p.get("color"), "size": p.get("size")}),
-                    p.get("discount_percentage"),
-                    datetime.fromtimestamp(p["event_timestamp"] / 1000),
-                ))
-            
-            if not values:
-                continue
-            
-            try:
-                execute_values(cursor, """
-                    INSERT INTO products (
-                        shop_id, category_id, brand_id, external_id, title,
-                        product_url, image_url, original_price_cents, sale_price_cents,
-                        in_stock, stock_quantity, availability_status, attributes,
-                        discount_percentage, last_scraped_at
-                    ) VALUES %s
-                    ON CONFLICT (shop_id, external_id) DO UPDATE SET
-                        category_id = EXCLUDED.category_id,
-                        brand_id = EXCLUDED.brand_id,
-                        title = EXCLUDED.title,
-                        product_url = EXCLUDED.product_url,
-                        image_url = EXCLUDED.image_url,
-                        original_price_cents = EXCLUDED.original_price_cents,
-                        sale_price_cents = EXCLUDED.sale_price_cents,
-                        in_stock = EXCLUDED.in_stock,
-                        stock_quantity = EXCLUDED.stock_quantity,
-                        availability_status = EXCLUDED.availability_status,
-                        attributes = EXCLUDED.attributes,
-                        discount_percentage = EXCLUDED.discount_percentage,
-                        last_scraped_at = EXCLUDED.last_scraped_at,
-                        updated_at = NOW()
-                """, values)
-                self.conn.commit()
-                inserted += len(values)
-            except psycopg2.Error as e:
-                print(f"⚠️  Error inserting batch: {e}")
-                self.conn.rollback()
-        
-        cursor.close()
-        self.rows_inserted += inserted
-        return inserted
+                    p.availability == "in_stock",
+                    p.stock_quantity,
+                    p.availability or "unknown",
+                    attributes[p.color, p.size],
+                    p.discount_percentage,
+                    last_scraped_at,
+                )
     
     def __enter__(self):
         return self.connect()
@@ -1008,110 +1714,344 @@ class DatabaseSeeder:
         self.close()
 
 
+async def _async_insert_products(
+    products: Iterable[Product],
+    db_url: str,
+    batch_size: int = 5000,
+    fresh_load: bool = False,
+) -> int:
+    """
+    Insert products over asyncpg's binary COPY protocol.
+
+    Mirrors DatabaseSeeder.insert_products: rows are copied into a temporary
+    staging table ``batch_size`` at a time and merged with the same upsert
+    (or, with ``fresh_load``, a plain INSERT after truncating products).
+    Unlike DatabaseSeeder.seed_all, only products are loaded here, in one
+    transaction with synchronous_commit off; the lookup tables must already
+    be seeded and committed.
+    """
+    conn = await asyncpg.connect(db_url)
+    try:
+        maps = {"s": {}, "c": {}, "b": {}}
+        for kind, row_id, name in await conn.fetch("""
+            SELECT 's', id, name FROM shops
+            UNION ALL SELECT 'c', id, name FROM categories
+            UNION ALL SELECT 'b', id, lower(name) FROM brands
+        """):
+            maps[kind][name] = row_id
+        
+        rows = DatabaseSeeder._product_rows(products, maps["s"], maps["c"], maps["b"])
+        # Binary COPY needs native values for the numeric and timestamp columns
+        records = (
+            (
+                *row[:13],
+                None if row[13] is None else Decimal(str(row[13])),
+                # fromisoformat only accepts a "Z" suffix from Python 3.11
+                datetime.fromisoformat(row[14].replace("Z", "+00:00")),
+            )
+            for row in rows
+        )
+        batches = iter(lambda: list(islice(records, batch_size)), [])
+        progress_iter = tqdm(batches, desc="Inserting products (async)") if HAS_TQDM else batches
+        
+        async with conn.transaction():
+            await conn.execute("SET LOCAL synchronous_commit = off")
+            if fresh_load:
+                await conn.execute(DatabaseSeeder.PRODUCT_TRUNCATE_SQL)
+            await conn.execute(DatabaseSeeder.PRODUCT_STAGE_SQL)
+            for batch in progress_iter:
+                await conn.copy_records_to_table(
+                    "products_stage", records=batch, columns=DatabaseSeeder.PRODUCT_COLUMNS
+                )
+            status = await conn.execute(
+                DatabaseSeeder.PRODUCT_LOAD_SQL if fresh_load else DatabaseSeeder.PRODUCT_MERGE_SQL
+            )
+        # Command tag is "INSERT 0 <rows>"
+        return int(status.rsplit(" ", 1)[-1])
+    finally:
+        await conn.close()
+
+
+def insert_products_async(
+    products: Iterable[Product],
+    db_url: Optional[str] = None,
+    batch_size: int = 5000,
+    fresh_load: bool = False,
+) -> int:
+    """
+    Insert products with asyncpg. Returns number of products inserted.
+
+    The load is all-or-nothing; a failure is reported and re-raised.
+    """
+    if not HAS_ASYNCPG:
+        raise ImportError("asyncpg is required for async ingest. Install with: pip install asyncpg")
+    
+    try:
+        return asyncio.run(
+            _async_insert_products(products, get_db_url(db_url), batch_size, fresh_load)
+        )
+    except asyncpg.PostgresError as e:
+        print(f"⚠️  Error inserting products: {e}")
+        raise
+
+
 # ============================================================================
 # SQL EXPORT
 # ============================================================================
 
+def _esc_str(value: str) -> str:
+    """Quote a str for SQL insertion, escaping quotes and backslashes."""
+    return "'" + value.replace("'", "''").replace("\\", "\\\\") + "'"
+
+
+def _esc_bool(value: bool) -> str:
+    """Render a bool as a SQL literal."""
+    return "TRUE" if value else "FALSE"
+
+
+def _esc_dt(value: datetime) -> str:
+    """Quote a datetime as an ISO-8601 SQL literal."""
+    return "'" + value.isoformat() + "'"
+
+
 def escape_sql_string(value: Any) -> str:
-    """Escape a string value for SQL insertion."""
+    """Escape a value of any supported type for SQL insertion."""
     if value is None:
         return "NULL"
     if isinstance(value, bool):
-        return "TRUE" if value else "FALSE"
+        return _esc_bool(value)
     if isinstance(value, (int, float)):
         return str(value)
-    if isinstance(value, (datetime,)):
-        return f"'{value.isoformat()}'"
-    
-    # String escaping
-    s = str(value)
-    s = s.replace("'", "''")  # Escape single quotes
-    s = s.replace("\\", "\\\\")  # Escape backslashes
-    return f"'{s}'"
+    if isinstance(value, datetime):
+        return _esc_dt(value)
+    return _esc_str(str(value))
+
+
+# Rows per multi-row INSERT statement in the SQL export
+SQL_ROWS_PER_STATEMENT = 1000
+
+_PRODUCTS_INSERT_SQL = """WITH s AS (SELECT id FROM shops WHERE name = {shop_name})
+INSERT INTO products (shop_id, category_id, external_id, title, product_url, image_url,
+    original_price_cents, sale_price_cents, in_stock, stock_quantity, availability_status,
+    attributes, discount_percentage, last_scraped_at)
+SELECT DISTINCT ON (v.external_id)
+    s.id, c.id, v.external_id, v.title, v.product_url, v.image_url,
+    v.original_price_cents::integer, v.sale_price_cents::integer, v.in_stock::boolean,
+    v.stock_quantity::integer, v.availability_status, v.attributes::jsonb,
+    v.discount_percentage::numeric, v.last_scraped_at::timestamptz
+FROM s, (VALUES
+{rows}
+) AS v(category_name, external_id, title, product_url, image_url,
+    original_price_cents, sale_price_cents, in_stock, stock_quantity, availability_status,
+    attributes, discount_percentage, last_scraped_at)
+LEFT JOIN categories c ON c.name = v.category_name
+ORDER BY v.external_id, v.last_scraped_at::timestamptz DESC
+ON CONFLICT (shop_id, external_id) DO UPDATE SET
+    title = EXCLUDED.title,
+    sale_price_cents = EXCLUDED.sale_price_cents,
+    updated_at = NOW();"""
+
+# LEFT JOIN so an unknown external_id yields a NULL product_id and trips the
+# NOT NULL constraint, as the old per-row subquery did, instead of silently
+# dropping the row
+_PRICE_HISTORY_INSERT_SQL = """INSERT INTO price_history (id, product_id, original_price_cents, sale_price_cents, in_stock, recorded_at, event_type)
+SELECT v.id::uuid, p.id, v.original_price_cents::integer, v.sale_price_cents::integer,
+    v.in_stock::boolean, v.recorded_at::timestamptz, v.event_type
+FROM (VALUES
+{rows}
+) AS v(id, external_id, original_price_cents, sale_price_cents, in_stock, recorded_at, event_type)
+LEFT JOIN LATERAL (SELECT id FROM products WHERE external_id = v.external_id LIMIT 1) p ON TRUE;"""
+
+
+# Escaped category and attribute literals, cached per distinct value
+_CATEGORY_SQL = _LookupCache(lambda category: _esc_str(CATEGORY_MAP.get(category, category)))
+_ATTRIBUTES_SQL = _LookupCache(
+    lambda variant: _esc_str(json.dumps({"color": variant[0], "size": variant[1]}))
+)
+
+
+def _fmt_product_sql(shop_name: str, batch: Sequence[Product]) -> str:
+    """Format one shop's batch of products as a single INSERT statement."""
+    scraped_at = _utc_timestamps((p.event_timestamp for p in batch), len(batch))
+    rows = ",\n".join(
+        "(" + ", ".join((
+            _CATEGORY_SQL[p.category],
+            _esc_str(p.source_product_id),
+            _esc_str(p.title[:500]),
+            _esc_str(p.product_url),
+            _esc_str(p.image_url),
+            str(p.original_price_cents or "NULL"),
+            str(p.sale_price_cents),
+            _esc_bool(p.availability == "in_stock"),
+            str(p.stock_quantity or "NULL"),
+            _esc_str(p.availability or "unknown"),
+            _ATTRIBUTES_SQL[p.color, p.size],
+            str(p.discount_percentage or "NULL"),
+            _esc_str(last_scraped_at),
+        )) + ")"
+        for p, last_scraped_at in zip(batch, scraped_at)
+    )
+    return _PRODUCTS_INSERT_SQL.format(shop_name=_esc_str(shop_name), rows=rows)
+
+
+# Products being exported, installed in each worker process once at startup
+_export_products: Sequence[Product] = ()
+
+
+def _init_sql_worker(products: Sequence[Product]) -> None:
+    """Worker initializer: install the product list for _fmt_product_sql_range."""
+    global _export_products
+    _export_products = products
+
+
+def _fmt_product_sql_range(task: Tuple[str, int, int]) -> str:
+    """Worker entry point: format ``_export_products[start:stop]``."""
+    shop_name, start, stop = task
+    return _fmt_product_sql(shop_name, _export_products[start:stop])
+
+
+def _product_statement_ranges(products: Sequence[Product]) -> Iterator[Tuple[str, int, int]]:
+    """Split products (sorted by source) into per-shop ``(shop_name, start, stop)`` statements."""
+    start = 0
+    for source, group in groupby(products, key=attrgetter("source")):
+        stop = start + sum(1 for _ in group)
+        for lo in range(start, stop, SQL_ROWS_PER_STATEMENT):
+            yield _SHOP_KEYS[source], lo, min(lo + SQL_ROWS_PER_STATEMENT, stop)
+        start = stop
 
 
 def generate_sql_inserts(
-    products: List[Dict[str, Any]],
+    products: List[Product],
     price_history: Optional[List[Dict[str, Any]]] = None,
     analytics: Optional[Dict[str, List[Dict[str, Any]]]] = None,
-) -> str:
-    """Generate SQL INSERT statements for products and related data."""
-    lines = []
-    lines.append("-- SkateStock Demo Data SQL Export")
-    lines.append(f"-- Generated: {datetime.now().isoformat()}")
-    lines.append("")
-    lines.append("BEGIN;")
-    lines.append("")
+    out: Optional[TextIO] = None,
+    workers: int = 1,
+) -> Optional[str]:
+    """
+    Generate SQL INSERT statements for products and related data.
+
+    Statements are written to ``out`` as they are built, so the full export is
+    never held in memory. Without ``out`` the SQL is returned as a string.
+    With ``workers > 1`` product statements are formatted in worker processes.
+
+    Products are grouped by shop and each group is written as multi-row
+    ``INSERT ... SELECT FROM (VALUES ...)`` statements of up to
+    ``SQL_ROWS_PER_STATEMENT`` rows. The shop id is looked up once per
+    statement; category and product ids are resolved with joins.
+    """
+    buf = io.StringIO() if out is None else None
+    write = (out or buf).write
+    write("-- SkateStock Demo Data SQL Export\n")
+    write(f"-- Generated: {datetime.now().isoformat()}\n")
+    write("\nBEGIN;\n\n")
     
     # Insert products
-    lines.append("-- Products")
-    for p in products:
-        values = {
-            "id": str(uuid.uuid4()),
-            "shop_id": "(SELECT id FROM shops WHERE name = " + escape_sql_string(p["source"].replace("_skateshop", "").replace("_store", "")) + ")",
-            "category_id": "(SELECT id FROM categories WHERE name = " + escape_sql_string(CATEGORY_MAP.get(p["category"], p["category"])) + ")",
-            "external_id": escape_sql_string(p["source_product_id"]),
-            "title": escape_sql_string(p["title"][:500]),
-            "product_url": escape_sql_string(p["product_url"]),
-            "image_url": escape_sql_string(p.get("image_url")),
-            "original_price_cents": int(float(p.get("original_price", 0)) * 100) if p.get("original_price") else "NULL",
-            "sale_price_cents": int(float(p["sale_price"]) * 100),
-            "in_stock": escape_sql_string(p.get("availability") == "in_stock"),
-            "stock_quantity": p.get("stock_quantity") or "NULL",
-            "availability_status": escape_sql_string(p.get("availability", "unknown")),
-            "attributes": escape_sql_string(json.dumps({"color": p.get("color"), "size": p.get("size")})),
-            "discount_percentage": p.get("discount_percentage") or "NULL",
-            "last_scraped_at": escape_sql_string(datetime.fromtimestamp(p["event_timestamp"] / 1000)),
-        }
-        
-        # For shop_id and category_id subqueries, we need special handling
-        sql = f"""INSERT INTO products (id, shop_id, category_id, external_id, title, product_url, image_url,
-            original_price_cents, sale_price_cents, in_stock, stock_quantity, availability_status,
-            attributes, discount_percentage, last_scraped_at)
-        SELECT 
-            {values['id']},
-            {values['shop_id']},
-            {values['category_id']},
-            {values['external_id']},
-            {values['title']},
-            {values['product_url']},
-            {values['image_url']},
-            {values['original_price_cents']},
-            {values['sale_price_cents']},
-            {values['in_stock']},
-            {values['stock_quantity']},
-            {values['availability_status']},
-            {values['attributes']},
-            {values['discount_percentage']},
-            {values['last_scraped_at']}
-        ON CONFLICT (shop_id, external_id) DO UPDATE SET
-            title = EXCLUDED.title,
-            sale_price_cents = EXCLUDED.sale_price_cents,
-            updated_at = NOW();"""
-        
-        lines.append(sql)
+    write("-- Products\n")
+    # Stable sort keeps each shop's products in their original order
+    by_source = sorted(products, key=attrgetter("source"))
+    ranges = _product_statement_ranges(by_source)
+    if workers > 1:
+        # Workers get the product list once via the initializer (inherited
+        # without pickling under fork) and only index ranges per task. Only a
+        # bounded window of ranges is in flight, so finished statements don't
+        # pile up while the writer drains them in order
+        window = workers * 4
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_sql_worker, initargs=(by_source,)
+        ) as executor:
+            pending = deque()
+            for task in ranges:
+                pending.append(executor.submit(_fmt_product_sql_range, task))
+                if len(pending) >= window:
+                    write(pending.popleft().result())
+                    write("\n")
+            while pending:
+                write(pending.popleft().result())
+                write("\n")
+    else:
+        for shop_name, start, stop in ranges:
+            write(_fmt_product_sql(shop_name, by_source[start:stop]))
+            write("\n")
     
     # Insert price history if provided
     if price_history:
-        lines.append("")
-        lines.append("-- Price History")
-        for h in price_history:
-            sql = f"""INSERT INTO price_history (id, product_id, original_price_cents, sale_price_cents, in_stock, recorded_at, event_type)
-            VALUES (
-                {escape_sql_string(h['id'])},
-                (SELECT id FROM products WHERE external_id = {escape_sql_string(h.get('product_event_id', ''))} LIMIT 1),
-                {h.get('original_price_cents') or 'NULL'},
-                {h['sale_price_cents']},
-                {escape_sql_string(h.get('in_stock', True))},
-                {escape_sql_string(h['recorded_at'])},
-                {escape_sql_string(h.get('event_type', 'price_check'))}
-            );"""
-            lines.append(sql)
-    
-    lines.append("")
-    lines.append("COMMIT;")
-    
-    return "\n".join(lines)
+        write("\n-- Price History\n")
+        history_iter = iter(price_history)
+        for batch in iter(lambda: list(islice(history_iter, SQL_ROWS_PER_STATEMENT)), []):
+            rows = ",\n".join(
+                "(" + ", ".join((
+                    _esc_str(h["id"]),
+                    _esc_str(h.get("product_event_id", "")),
+                    str(h.get("original_price_cents") or "NULL"),
+                    str(h["sale_price_cents"]),
+                    _esc_bool(h.get("in_stock", True)),
+                    escape_sql_string(h["recorded_at"]),
+                    _esc_str(h.get("event_type", "price_check")),
+                )) + ")"
+                for h in batch
+            )
+            write(_PRICE_HISTORY_INSERT_SQL.format(rows=rows))
+            write("\n")
+    
+    write("\nCOMMIT;")
+    
+    return buf.getvalue() if buf is not None else None
+
+
+# ============================================================================
+# JSON EXPORT
+# ============================================================================
+
+def _json_default(value: Any) -> Any:
+    """Fallback serializer for values the JSON encoder does not handle natively."""
+    if isinstance(value, Product):
+        return value.to_dict()
+    return str(value)
+
+
+def _json_bytes(value: Any) -> bytes:
+    """Serialize compactly, with orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(value, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(value, default=_json_default, separators=(",", ":")).encode()
+
+
+def _write_json_array(f: BinaryIO, items: Iterable[Any], chunk_size: int = 10_000) -> None:
+    """Write ``items`` as a JSON array, serializing ``chunk_size`` items at a time."""
+    items = iter(items)
+    f.write(b"[")
+    for i, chunk in enumerate(iter(lambda: list(islice(items, chunk_size)), [])):
+        if i:
+            f.write(b",")
+        f.write(_json_bytes(chunk)[1:-1])
+    f.write(b"]")
+
+
+def write_json_output(
+    path: str,
+    products: List[Product],
+    metadata: Dict[str, Any],
+    price_history: Optional[List[Dict[str, Any]]] = None,
+    analytics: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+):
+    """
+    Stream the dataset to ``path`` as compact JSON.
+
+    Large lists are serialized in chunks so the full document is never held
+    in memory as one string.
+    """
+    with open(path, "wb") as f:
+        f.write(b'{"products":')
+        _write_json_array(f, products)
+        f.write(b',"metadata":')
+        f.write(_json_bytes(metadata))
+        if price_history:
+            f.write(b',"price_history":')
+            _write_json_array(f, price_history)
+        if analytics:
+            f.write(b',"analytics":')
+            f.write(_json_bytes(analytics))
+        f.write(b"}\n")
 
 
 # ============================================================================
@@ -1119,47 +2059,93 @@ def generate_sql_inserts(
 # ============================================================================
 
 def seed_database_api(
-    products: List[Dict[str, Any]],
+    products: List[Product],
     api_url: str = "http://localhost:8000",
-):
-    """Seed the database via API."""
+) -> bool:
+    """Seed the database via API. Returns True if every batch was inserted."""
     if not HAS_REQUESTS:
         print("❌ requests library not available. Install with: pip install requests")
-        return
+        return False
     
     print(f"🌱 Seeding {len(products)} products via API...")
 
-    # Batch insert via API
+    # Batch insert via API, posting batches concurrently over pooled connections
     batch_size = 100
-    progress_iter = tqdm(range(0, len(products), batch_size), desc="API seeding") if HAS_TQDM else range(0, len(products), batch_size)
+    total_batches = (len(products) - 1) // batch_size + 1
+    url = f"{api_url}/demo/bulk-insert"
     
-    for i in progress_iter:
-        batch = products[i : i + batch_size]
-        try:
-            response = requests.post(
-                f"{api_url}/demo/bulk-insert",
-                json={"products": batch},
-                timeout=30,
-            )
-            if response.status_code == 200:
-                if not HAS_TQDM:
-                    print(f"  ✅ Batch {i//batch_size + 1}/{(len(products)-1)//batch_size + 1} inserted")
-            else:
-                print(f"  ⚠️  Batch {i//batch_size + 1} failed: {response.status_code}")
-        except requests.exceptions.ConnectionError:
-            print(f"  ❌ Cannot connect to API at {api_url}")
-            print("  💡 Is the stack running? Run 'make demo' first")
-            break
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
-
+    # Only failed connects are retried: bulk-insert isn't idempotent, so
+    # re-sending a POST after a gateway error could insert a batch twice
+    # (POST is left out of Retry's default allowed_methods)
+    session = requests.Session()
+    session.mount(api_url, HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=8,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    ))
+    
+    def post_batch(start: int):
+        batch = products[start : start + batch_size]
+        return session.post(url, json={"products": [p.to_dict() for p in batch]}, timeout=30)
+    
+    with session, ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {
+            executor.submit(post_batch, i): i // batch_size + 1
+            for i in range(0, len(products), batch_size)
+        }
+        completed = as_completed(futures)
+        progress_iter = tqdm(completed, total=len(futures), desc="API seeding") if HAS_TQDM else completed
+        failed = 0
+        aborted = False
+        
+        for future in progress_iter:
+            batch_num = futures[future]
+            try:
+                response = future.result()
+                if response.status_code == 200:
+                    if not HAS_TQDM:
+                        print(f"  ✅ Batch {batch_num}/{total_batches} inserted")
+                else:
+                    failed += 1
+                    print(f"  ⚠️  Batch {batch_num} failed: {response.status_code}")
+            except requests.exceptions.ConnectionError:
+                print(f"  ❌ Cannot connect to API at {api_url}")
+                print("  💡 Is the stack running? Run 'make demo' first")
+                for pending in futures:
+                    pending.cancel()
+                aborted = True
+                break
+            except Exception as e:
+                failed += 1
+                print(f"  ❌ Error: {e}")
+
+    if aborted:
+        print("❌ API seeding aborted")
+        return False
+    if failed:
+        print(f"⚠️  API seeding finished with {failed}/{total_batches} batches failed")
+        return False
     print("✅ API seeding complete")
+    return True
 
 
 # ============================================================================
 # MAIN
 # ============================================================================
 
+def print_validation(valid_count: int, errors: List[str]):
+    """Print the validation result."""
+    if errors:
+        print(f"  ⚠️  {len(errors)} validation errors found:")
+        for error in errors[:10]:  # Show first 10
+            print(f"    - {error}")
+        if len(errors) > 10:
+            print(f"    ... and {len(errors) - 10} more")
+    else:
+        print(f"  ✅ All {valid_count} products validated successfully")
+    print()
+
+
 def print_summary(stats: Dict[str, Any]):
     """Print generation summary."""
     print("\n" + "=" * 60)
@@ -1221,7 +2207,11 @@ Examples:
         "--seed",
         type=int,
         default=42,
-        help="Random seed for reproducibility (default: 42)",
+        help=(
+            "Random seed for reproducibility (default: 42). Each (day, retailer) batch "
+            "is seeded with seed + day * 997 + retailer index, so output is identical "
+            "for any --workers count but differs from releases that used one stream"
+        ),
     )
     parser.add_argument(
         "--output",
@@ -1249,6 +2239,16 @@ Examples:
         action="store_true",
         help="Insert directly to PostgreSQL database",
     )
+    parser.add_argument(
+        "--fresh-load",
+        action="store_true",
+        help=(
+            "Truncate products before a direct-to-db insert and skip conflict handling. "
+            "WARNING: also empties every table referencing products (price_history, "
+            "price_trends, product_fingerprints, data_quality_issues, alert_history). "
+            "Products load on a single connection so the truncate and load commit together"
+        ),
+    )
     parser.add_argument(
         "--db-url",
         type=str,
@@ -1281,11 +2281,35 @@ Examples:
         default=True,
         help="Validate generated data (default: True)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Worker processes for product generation and --output-sql formatting "
+            "(default: 1, no process pool)"
+        ),
+    )
+    parser.add_argument(
+        "--async-ingest",
+        action="store_true",
+        help=(
+            "Insert products with asyncpg binary COPY (requires asyncpg). Lookup tables "
+            "are seeded and committed first over psycopg2, then products load in a "
+            "separate transaction with synchronous_commit off"
+        ),
+    )
+    parser.add_argument(
+        "--db-workers",
+        type=int,
+        default=4,
+        help="Parallel COPY connections for --direct-to-db (default: 4)",
+    )
     parser.add_argument(
         "--batch-size",
         type=int,
-        default=100,
-        help="Batch size for database inserts (default: 100)",
+        default=5000,
+        help="Rows per COPY batch for database inserts (default: 5000)",
     )
 
     args = parser.parse_args()
@@ -1320,30 +2344,38 @@ Examples:
         return 0
 
     # Initialize generator
-    generator = DemoDataGenerator(seed=args.seed, chaos_mode=args.chaos)
+    generator = DemoDataGenerator(seed=args.seed, chaos_mode=args.chaos, workers=args.workers)
     
-    # Generate products
-    products = generator.generate_demo_dataset(
-        days=args.days,
-        products_per_day=args.products_per_day,
+    # Generate products. A direct-to-db insert with no other consumer streams
+    # them into the COPY as they are generated (validating on the way);
+    # price history, analytics, file output and API seeding need the full list
+    stream_to_db = args.direct_to_db and not (
+        args.price_history_days > 0
+        or args.generate_analytics
+        or args.output
+        or args.output_sql
     )
-    
-    print(f"📊 Generated {len(products)} product events")
+    stream_report = {"valid": 0, "errors": []}
+    if stream_to_db:
+        products = generator.iter_products(
+            days=args.days,
+            products_per_day=args.products_per_day,
+        )
+        if args.validate:
+            products = DataValidator.iter_validated(products, stream_report)
+        print("📊 Streaming product events into the database")
+    else:
+        products = generator.generate_demo_dataset(
+            days=args.days,
+            products_per_day=args.products_per_day,
+        )
+        print(f"📊 Generated {len(products)} product events")
     print()
     
     # Validate data
-    if args.validate:
+    if args.validate and not stream_to_db:
         print("🔍 Validating generated data...")
-        valid_count, errors = DataValidator.validate_products(products)
-        if errors:
-            print(f"  ⚠️  {len(errors)} validation errors found:")
-            for error in errors[:10]:  # Show first 10
-                print(f"    - {error}")
-            if len(errors) > 10:
-                print(f"    ... and {len(errors) - 10} more")
-        else:
-            print(f"  ✅ All {valid_count} products validated successfully")
-        print()
+        print_validation(*DataValidator.validate_products(products))
     
     # Generate price history if requested
     price_history = None
@@ -1365,29 +2397,19 @@ Examples:
     
     # Save to JSON file if requested
     if args.output:
-        output_data = {
-            "products": products,
-            "metadata": {
-                "generated_at": datetime.now().isoformat(),
-                "days": args.days,
-                "products_per_day": args.products_per_day,
-                "total_products": len(products),
-            }
+        metadata = {
+            "generated_at": datetime.now().isoformat(),
+            "days": args.days,
+            "products_per_day": args.products_per_day,
+            "total_products": len(products),
         }
-        if price_history:
-            output_data["price_history"] = price_history
-        if analytics:
-            output_data["analytics"] = analytics
-            
-        with open(args.output, "w") as f:
-            json.dump(output_data, f, indent=2, default=str)
+        write_json_output(args.output, products, metadata, price_history, analytics)
         print(f"💾 Saved to {args.output}")
     
     # Save to SQL file if requested
     if args.output_sql:
-        sql = generate_sql_inserts(products, price_history, analytics)
-        with open(args.output_sql, "w") as f:
-            f.write(sql)
+        with open(args.output_sql, "w", buffering=1 << 20) as f:
+            generate_sql_inserts(products, price_history, analytics, out=f, workers=args.workers)
         print(f"💾 Saved SQL to {args.output_sql}")
     
     # Insert directly to database
@@ -1396,27 +2418,53 @@ Examples:
             print("❌ psycopg2-binary is required for database operations.")
             print("   Install with: pip install psycopg2-binary")
             return 1
+        if args.async_ingest and not HAS_ASYNCPG:
+            print("❌ asyncpg is required for --async-ingest.")
+            print("   Install with: pip install asyncpg")
+            return 1
         
         print("🗄️  Inserting directly to database...")
-        with DatabaseSeeder(args.db_url) as seeder:
-            # First seed shops and categories if they don't exist
-            seeder.seed_shops()
-            seeder.seed_categories()
-            seeder.seed_brands()
-            
-            # Then insert products
-            count = seeder.insert_products(products, batch_size=args.batch_size)
-            print(f"✅ Inserted {count} products")
-            
-            generator.stats["db_rows_inserted"] = seeder.rows_inserted
+        try:
+            with DatabaseSeeder(args.db_url, workers=args.db_workers) as seeder:
+                if args.async_ingest:
+                    # Lookup tables commit on their own before the asyncpg load
+                    seeder.seed_lookup_tables()
+                    try:
+                        count = insert_products_async(
+                            products, args.db_url, batch_size=args.batch_size,
+                            fresh_load=args.fresh_load,
+                        )
+                    except asyncpg.PostgresError as e:
+                        print(f"❌ Database insert failed: {e}")
+                        return 1
+                    seeder.rows_inserted += count
+                else:
+                    # Seed shops, categories and brands, then products, in one go
+                    count = seeder.seed_all(
+                        products, batch_size=args.batch_size, fresh_load=args.fresh_load
+                    )
+                print(f"✅ Inserted {count} products")
+                
+                if analytics:
+                    count = seeder.insert_metrics(analytics["metrics"])
+                    print(f"✅ Inserted {count} metrics")
+                
+                generator.stats["db_rows_inserted"] = seeder.rows_inserted
+        except psycopg2.Error as e:
+            print(f"❌ Database insert failed: {e}")
+            return 1
+        
+        if stream_to_db and args.validate:
+            print("🔍 Validated streamed data...")
+            print_validation(stream_report["valid"], stream_report["errors"])
     
     # Seed via API (original functionality)
     elif not args.no_seed_db:
         if not HAS_REQUESTS:
             print("❌ requests library not available. Install with: pip install requests")
             print("   Or use --direct-to-db flag to insert directly to database")
-        else:
-            seed_database_api(products, args.api_url)
+        elif not seed_database_api(products, args.api_url):
+            return 1
     
     # Print summary
     print_summary(generator.stats)
@@ -6,21 +6,23 @@ These models represent the core entities in the skateboarding equipment ecosyste
 """
 
 from .deck import Deck, ConcaveType
-from .truck import Truck, TruckGeometry
+from .truck import Truck, TruckFlags, TruckGeometry
 from .wheel import Wheel, WheelFormula
-from .bearing import Bearing, ShieldType
-from .product import CompleteProduct, AvailabilityStatus, RetailerSource
+from .bearing import Bearing, BearingFlags, ShieldType
+from .product import AvailabilityStatus, RetailerSource, ProductUnion
 
 __all__ = [
     "Deck",
     "ConcaveType",
     "Truck",
     "TruckGeometry",
+    "TruckFlags",
     "Wheel",
     "WheelFormula",
     "Bearing",
     "ShieldType",
-    "CompleteProduct",
+    "BearingFlags",
     "AvailabilityStatus",
     "RetailerSource",
+    "ProductUnion",
 ]
@@ -0,0 +1,41 @@
+"""
+Bulk Construction - Shared ids and timestamps for trusted batches
+
+Building thousands of models one by one runs the id and timestamp default
+factories for every instance. For already-normalized scraper batches, draw
+all ids from a single urandom read and stamp the whole batch with one time.
+"""
+
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Sequence
+from uuid import UUID
+
+
+class BulkCtx:
+    """Pre-allocated ids and a single ingest timestamp for up to ``n`` models."""
+
+    def __init__(self, n: int):
+        raw = os.urandom(16 * n)
+        # version=4 sets the version/variant bits, so these are valid uuid4s
+        self.uuids: List[UUID] = [
+            UUID(bytes=raw[i : i + 16], version=4) for i in range(0, 16 * n, 16)
+        ]
+        self.now = datetime.now(timezone.utc)
+
+    def build(self, model: Any, rows: Sequence[Dict[str, Any]]) -> List[Any]:
+        """
+        Construct ``model`` instances from trusted rows via ``from_trusted``.
+
+        Each row gets the next pre-allocated id and the shared timestamp
+        unless it already carries its own.
+        """
+        if len(rows) > len(self.uuids):
+            raise ValueError(f"BulkCtx sized for {len(self.uuids)} rows, got {len(rows)}")
+        now = self.now
+        return [
+            model.from_trusted(
+                {"id": uuid, "created_at": now, "updated_at": now, **row}
+            )
+            for uuid, row in zip(self.uuids, rows)
+        ]
@@ -0,0 +1,21 @@
+"""
+Pricing Helpers - Vectorized row selection for catalog batches
+
+Testing every row of a large catalog refresh for a usable MSRP is done in one
+numpy pass; the discounts themselves stay exact Decimal math on the rows this
+picks out.
+"""
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+def discount_rows(msrps: ArrayLike) -> np.ndarray:
+    """
+    Indices of the rows whose MSRP is positive, i.e. that can carry a discount.
+
+    Rows without an MSRP (``None``/NaN) are skipped.
+    """
+    msrps = np.asarray(msrps, dtype=float)
+    with np.errstate(invalid="ignore"):
+        return np.flatnonzero(msrps > 0)
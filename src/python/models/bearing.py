@@ -5,13 +5,26 @@ Represents skateboard bearing specifications with focus on street skating
 favorites (Bones Reds, Bronson G3).
 """
 
-from datetime import datetime
-from decimal import Decimal
-from enum import Enum
-from typing import Optional
+import sys
+from datetime import datetime, timezone
+from enum import Enum, IntFlag
+from typing import Any, Dict, Literal, Mapping, Optional, Tuple
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    SerializerFunctionWrapHandler,
+    model_serializer,
+    model_validator,
+)
+
+
+def _utcnow() -> datetime:
+    """Timezone-aware UTC now, used as the timestamp default factory."""
+    return datetime.now(timezone.utc)
 
 
 class ShieldType(str, Enum):
@@ -23,6 +36,111 @@ class ShieldType(str, Enum):
     NONE = "None"  # Open bearings (not recommended)
 
 
+class BearingFlags(IntFlag):
+    """Boolean bearing features packed into a single field."""
+
+    SKATE_RATED = 1  # Bones 'Skate Rated' - designed for impact vs ABEC
+    CERAMIC = 2  # Ceramic balls (lighter, harder, rust-proof)
+    REMOVABLE_SHIELDS = 4  # Shields can be removed for cleaning
+    INCLUDES_SPACERS = 8
+    INCLUDES_WASHERS = 16
+
+
+# Former bool fields -> their flag, still accepted as input
+_BEARING_FLAG_FIELDS: Dict[str, BearingFlags] = {
+    "skate_rated": BearingFlags.SKATE_RATED,
+    "ceramic": BearingFlags.CERAMIC,
+    "removable_shields": BearingFlags.REMOVABLE_SHIELDS,
+    "includes_spacers": BearingFlags.INCLUDES_SPACERS,
+    "includes_washers": BearingFlags.INCLUDES_WASHERS,
+}
+
+
+def _fold_legacy_flags(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Fold the former bool fields (ceramic=True, ...) into ``flags``."""
+    if _BEARING_FLAG_FIELDS.keys().isdisjoint(data):
+        return data
+    data = dict(data)
+    flags = BearingFlags(data.get("flags", BearingFlags.REMOVABLE_SHIELDS))
+    for name, flag in _BEARING_FLAG_FIELDS.items():
+        if name in data:
+            flags = flags | flag if data.pop(name) else flags & ~flag
+    data["flags"] = flags
+    return data
+
+
+# Lowercased retailer spellings -> canonical brand name
+_BEARING_BRAND_MAP: Dict[str, str] = {
+    "bones": "Bones",
+    "bones bearings": "Bones",
+    "bones swiss": "Bones",
+    "bronson": "Bronson",
+    "bronson speed co": "Bronson",
+    "bronson speed company": "Bronson",
+    "shake junt": "Shake Junt",
+    "shakejunt": "Shake Junt",
+    "sj": "Shake Junt",
+    "andale": "Andalé",
+    "andale bearings": "Andalé",
+    "modus": "Modus",
+    "modus bearings": "Modus",
+    "independent": "Independent",
+    "indy": "Independent",
+    "independent bearings": "Independent",
+    "mob": "Mob",
+    "zero": "Zero",
+    "toy machine": "Toy Machine",
+}
+
+
+# Model rules keyed by canonical brand, checked in order: the first rule
+# whose substrings all appear in the lowercased model name wins
+_MODEL_RULES: Dict[str, Tuple[Tuple[Tuple[str, ...], str], ...]] = {
+    "Bones": (
+        (("swiss", "ceramic"), "Swiss Ceramic"),
+        (("swiss",), "Swiss"),
+        (("super",), "Super Reds"),
+        (("reds",), "Reds"),
+        (("big balls",), "Big Balls"),
+    ),
+    "Bronson": (
+        (("g3",), "G3"),
+        (("g-3",), "G3"),
+        (("raw",), "RAW"),
+        (("ceramic",), "Ceramic"),
+    ),
+    "Andalé": (
+        (("pro",), "Pro Rated"),
+        ((" daewon ",), "Daewon Song Pro"),
+        (("tiago",), "Tiago Pro"),
+    ),
+}
+
+
+def _canon_brand(brand: str) -> str:
+    """Canonical bearing brand name for a retailer spelling."""
+    return sys.intern(_BEARING_BRAND_MAP.get(brand.lower().strip(), brand.title()))
+
+
+def _canon_model_for(brand: str, model: str) -> str:
+    """Canonical model name under an already-canonical brand."""
+    model_lower = model.lower().strip()
+    for needles, canonical in _MODEL_RULES.get(brand, ()):
+        if all(needle in model_lower for needle in needles):
+            return canonical
+    return sys.intern(model.title())
+
+
+# Labels for the precomputed quality_tier / maintenance_ease codes
+_QUALITY_TIERS = ("Premium", "High-End", "Mid-Range", "Standard")
+_MAINTENANCE_EASE = (
+    "Easy (removable shields)",
+    "Moderate (metal shields)",
+    "High maintenance (open)",
+    "Standard",
+)
+
+
 class Bearing(BaseModel):
     """
     Skateboard bearing with street skating specifications.
@@ -40,9 +158,28 @@ class Bearing(BaseModel):
     - Shield: Rubber (cleanable) vs Metal (durable)
     """
 
+    # Immutable once built, so instances are hashable for catalog dedup.
+    # Derive changed copies with model_copy(update=...), which recomputes the
+    # label codes
+    # Validators are built eagerly at import, and model instances passed back
+    # in (e.g. into a list adapter) are reused without revalidation.
+    # When compiled with Cython (make models-compile) methods are cyfunctions,
+    # which pydantic would reject as non-annotated fields without ignored_types
+    model_config = ConfigDict(
+        frozen=True,
+        validate_assignment=False,
+        revalidate_instances="never",
+        defer_build=False,
+        extra="ignore",
+        ignored_types=(type(_utcnow),),
+    )
+
     # Identity
     id: UUID = Field(default_factory=uuid4)
     sku: str = Field(..., description="Retailer-specific SKU")
+    category: Literal["bearing"] = Field(
+        default="bearing", description="Product type tag (ProductCategory value)"
+    )
 
     # Brand & Model
     brand: str = Field(
@@ -56,20 +193,15 @@ class Bearing(BaseModel):
     abec_rating: Optional[str] = Field(
         None, description="ABEC rating (3, 5, 7, 9) - mostly marketing"
     )
-    skate_rated: bool = Field(
-        default=False, description="Bones 'Skate Rated' - designed for impact vs ABEC"
-    )
-    ceramic: bool = Field(
-        default=False, description="Ceramic balls (lighter, harder, rust-proof)"
+    flags: BearingFlags = Field(
+        default=BearingFlags.REMOVABLE_SHIELDS,
+        description="Skate rated / ceramic / removable shields / spacers / washers",
     )
 
     # Shield Configuration
     shield_type: ShieldType = Field(
         default=ShieldType.RUBBER_SHIELD, description="Bearing shield type"
     )
-    removable_shields: bool = Field(
-        default=True, description="Whether shields can be removed for cleaning"
-    )
 
     # Construction
     ball_material: str = Field(default="Steel", description="Material of bearing balls")
@@ -83,12 +215,6 @@ class Bearing(BaseModel):
         le=8,
         description="Number of bearings in set (usually 8 for skateboard)",
     )
-    includes_spacers: bool = Field(
-        default=False, description="Whether spacers are included"
-    )
-    includes_washers: bool = Field(
-        default=False, description="Whether speed washers are included"
-    )
 
     # Performance indicators
     precision_grade: Optional[str] = Field(
@@ -96,99 +222,128 @@ class Bearing(BaseModel):
     )
 
     # Metadata
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
 
-    @field_validator("brand")
-    @classmethod
-    def canonicalize_brand(cls, v: str) -> str:
-        """Normalize bearing brand names."""
-        brand_map = {
-            "bones": "Bones",
-            "bones bearings": "Bones",
-            "bones swiss": "Bones",
-            "bronson": "Bronson",
-            "bronson speed co": "Bronson",
-            "bronson speed company": "Bronson",
-            "shake junt": "Shake Junt",
-            "shakejunt": "Shake Junt",
-            "sj": "Shake Junt",
-            "andale": "Andalé",
-            "andale bearings": "Andalé",
-            "modus": "Modus",
-            "modus bearings": "Modus",
-            "independent": "Independent",
-            "indy": "Independent",
-            "independent bearings": "Independent",
-            "mob": "Mob",
-            "zero": "Zero",
-            "toy machine": "Toy Machine",
-        }
-        return brand_map.get(v.lower().strip(), v.title())
-
-    @field_validator("model")
+    # Indexes into _QUALITY_TIERS / _MAINTENANCE_EASE, set by canonicalize
+    _quality_tier_idx: int = PrivateAttr(default=3)
+    _maintenance_idx: int = PrivateAttr(default=3)
+
+    @model_validator(mode="before")
     @classmethod
-    def canonicalize_model(cls, v: str, info) -> str:
-        """Normalize bearing model names."""
-        brand = info.data.get("brand", "").lower()
-        v_lower = v.lower().strip()
-
-        # Bones models
-        if brand == "bones":
-            if "swiss" in v_lower and "ceramic" in v_lower:
-                return "Swiss Ceramic"
-            elif "swiss" in v_lower:
-                return "Swiss"
-            elif "super reds" in v_lower or "super" in v_lower:
-                return "Super Reds"
-            elif "reds" in v_lower:
-                return "Reds"
-            elif "big balls" in v_lower:
-                return "Big Balls"
-
-        # Bronson models
-        if brand == "bronson":
-            if "g3" in v_lower or "g-3" in v_lower:
-                return "G3"
-            elif "raw" in v_lower:
-                return "RAW"
-            elif "ceramic" in v_lower:
-                return "Ceramic"
-
-        # Andalé models
-        if brand in ["andalé", "andale"]:
-            if "pro" in v_lower:
-                return "Pro Rated"
-            elif " daewon " in v_lower:
-                return "Daewon Song Pro"
-            elif "tiago" in v_lower:
-                return "Tiago Pro"
-
-        return v.title()
+    def fold_legacy_flags(cls, data: Any) -> Any:
+        """Fold the former bool fields (ceramic=True, ...) into ``flags``."""
+        if isinstance(data, dict):
+            return _fold_legacy_flags(data)
+        return data
+
+    @model_serializer(mode="wrap")
+    def dump_legacy_flags(
+        self, handler: SerializerFunctionWrapHandler
+    ) -> Dict[str, Any]:
+        """Also emit the former bool fields so the serialized shape is unchanged."""
+        data = handler(self)
+        if "flags" not in data:
+            return data
+        for name, flag in _BEARING_FLAG_FIELDS.items():
+            data[name] = bool(self.flags & flag)
+        return data
+
+    @model_validator(mode="after")
+    def canonicalize(self) -> "Bearing":
+        """
+        Normalize brand and model names, then resolve the derived label codes.
+
+        A single pass with both fields in hand, since the model name rules
+        depend on the canonical brand.
+        """
+        brand = _canon_brand(self.brand)
+        # Frozen model: write the canonical values straight into the field dict
+        self.__dict__["brand"] = brand
+        self.__dict__["model"] = _canon_model_for(brand, self.model)
+        self._set_label_codes()
+        return self
+
+    def _set_label_codes(self) -> None:
+        """Compute the quality tier and maintenance codes from the current fields."""
+        model = self.model.lower()
+        if self.ceramic or "swiss" in model:
+            self._quality_tier_idx = 0
+        elif "super" in model or "g3" in model:
+            self._quality_tier_idx = 1
+        elif model in ("reds", "raw"):
+            self._quality_tier_idx = 2
+        else:
+            self._quality_tier_idx = 3
+
+        if self.shield_type == ShieldType.RUBBER_SHIELD and self.removable_shields:
+            self._maintenance_idx = 0
+        elif self.shield_type == ShieldType.METAL_SHIELD:
+            self._maintenance_idx = 1
+        elif self.shield_type == ShieldType.NONE:
+            self._maintenance_idx = 2
+        else:
+            self._maintenance_idx = 3
+
+    @property
+    def skate_rated(self) -> bool:
+        """Bones 'Skate Rated' - designed for impact vs ABEC."""
+        return bool(self.flags & BearingFlags.SKATE_RATED)
+
+    @property
+    def ceramic(self) -> bool:
+        """Ceramic balls (lighter, harder, rust-proof)."""
+        return bool(self.flags & BearingFlags.CERAMIC)
+
+    @property
+    def removable_shields(self) -> bool:
+        """Whether shields can be removed for cleaning."""
+        return bool(self.flags & BearingFlags.REMOVABLE_SHIELDS)
+
+    @property
+    def includes_spacers(self) -> bool:
+        """Whether spacers are included."""
+        return bool(self.flags & BearingFlags.INCLUDES_SPACERS)
+
+    @property
+    def includes_washers(self) -> bool:
+        """Whether speed washers are included."""
+        return bool(self.flags & BearingFlags.INCLUDES_WASHERS)
 
     @property
     def quality_tier(self) -> str:
         """Determine quality tier based on specs."""
-        if self.ceramic or "swiss" in self.model.lower():
-            return "Premium"
-        elif "super" in self.model.lower() or "g3" in self.model.lower():
-            return "High-End"
-        elif self.model.lower() in ["reds", "raw"]:
-            return "Mid-Range"
-        else:
-            return "Standard"
+        return _QUALITY_TIERS[self._quality_tier_idx]
 
     @property
     def maintenance_ease(self) -> str:
         """Determine how easy bearings are to maintain."""
-        if self.shield_type == ShieldType.RUBBER_SHIELD and self.removable_shields:
-            return "Easy (removable shields)"
-        elif self.shield_type == ShieldType.METAL_SHIELD:
-            return "Moderate (metal shields)"
-        elif self.shield_type == ShieldType.NONE:
-            return "High maintenance (open)"
-        else:
-            return "Standard"
+        return _MAINTENANCE_EASE[self._maintenance_idx]
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> "Bearing":
+        """Copy the model, recomputing the label codes when ``update`` is given."""
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            copy._set_label_codes()
+        return copy
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "Bearing":
+        """
+        Rebuild a Bearing from already-canonical data (e.g. a DB or cache row).
 
-    class Config:
-        json_encoders = {Decimal: str, UUID: str, datetime: lambda v: v.isoformat()}
+        Skips validation entirely via ``model_construct``, so only use this for
+        records that were validated before; scraper input goes through
+        ``model_validate``.
+        """
+        data = _fold_legacy_flags(data)
+        if "shield_type" in data:
+            # model_construct does no coercion, so enums must be members already
+            data = {**data, "shield_type": ShieldType(data["shield_type"])}
+        if "flags" in data:
+            data = {**data, "flags": BearingFlags(data["flags"])}
+        bearing = cls.model_construct(**data)
+        bearing._set_label_codes()
+        return bearing
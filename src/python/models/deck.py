@@ -5,13 +5,29 @@ Represents street skating deck specifications with domain-specific attributes
 for brands popular in the street skating community.
 """
 
-from datetime import datetime
+import sys
+from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import Any, Dict, List, Literal, Optional, Sequence
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
+
+
+def _utcnow() -> datetime:
+    """Timezone-aware UTC now, used as the timestamp default factory."""
+    return datetime.now(timezone.utc)
+
+
+def _to_decimal(value: Any) -> Decimal:
+    """Convert a money value to Decimal the way pydantic does (floats via str)."""
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+def _discount_off(price: Decimal, msrp: Decimal) -> Decimal:
+    """Discount percentage of ``price`` off ``msrp``, rounded to cents."""
+    return ((msrp - price) / msrp * 100).quantize(Decimal("0.01"))
 
 
 class ConcaveType(str, Enum):
@@ -23,6 +39,34 @@ class ConcaveType(str, Enum):
     FULL = "full"  # Maximum concave, old school feel
 
 
+# Lowercased retailer spellings -> canonical brand name
+_DECK_BRAND_MAP: Dict[str, str] = {
+    "baker skateboards": "Baker",
+    "baker": "Baker",
+    "deathwish skateboards": "Deathwish",
+    "deathwish": "Deathwish",
+    "palace skateboards": "Palace",
+    "palace": "Palace",
+    "fa world entertainment": "FA",
+    "fa": "FA",
+    "hockey": "Hockey",
+    "real skateboards": "Real",
+    "real": "Real",
+    "anti hero": "Anti-Hero",
+    "antihero": "Anti-Hero",
+    "girl skateboards": "Girl",
+    "girl": "Girl",
+    "chocolate": "Chocolate",
+    "flip skateboards": "Flip",
+    "flip": "Flip",
+    "polar skate co": "Polar",
+    "polar": "Polar",
+    "alltimers": "Alltimers",
+    "quasi": "Quasi",
+    "fucking awesome": "FA",
+}
+
+
 class Deck(BaseModel):
     """
     Skateboard deck with street skating specifications.
@@ -33,24 +77,38 @@ class Deck(BaseModel):
     - Concave: Medium to Steep for flip tricks
     """
 
+    # Immutable once built, so instances are hashable (e.g. for catalog dedup)
+    # Validators are built eagerly at import, and model instances passed back
+    # in (e.g. into a list adapter) are reused without revalidation
+    model_config = ConfigDict(
+        frozen=True,
+        validate_assignment=False,
+        revalidate_instances="never",
+        defer_build=False,
+        extra="ignore",
+    )
+
     # Identity
     id: UUID = Field(default_factory=uuid4)
     sku: str = Field(..., description="Retailer-specific SKU")
+    category: Literal["deck"] = Field(
+        default="deck", description="Product type tag (ProductCategory value)"
+    )
 
     # Physical Specifications
-    width_inches: Decimal = Field(
+    width_inches: float = Field(
         ...,
-        ge=Decimal("7.0"),
-        le=Decimal("10.0"),
+        ge=7.0,
+        le=10.0,
         description="Deck width in inches (street: 7.75-8.5)",
     )
-    length_inches: Decimal = Field(
-        ..., ge=Decimal("28.0"), le=Decimal("35.0"), description="Deck length in inches"
+    length_inches: float = Field(
+        ..., ge=28.0, le=35.0, description="Deck length in inches"
     )
-    wheelbase_inches: Optional[Decimal] = Field(
+    wheelbase_inches: Optional[float] = Field(
         None,
-        ge=Decimal("12.0"),
-        le=Decimal("16.0"),
+        ge=12.0,
+        le=16.0,
         description="Distance between truck mounting holes",
     )
     concave_type: ConcaveType = Field(
@@ -85,42 +143,28 @@ class Deck(BaseModel):
     )
 
     # Metadata
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
 
     @field_validator("brand")
     @classmethod
     def canonicalize_brand(cls, v: str) -> str:
         """Normalize brand names to canonical forms."""
-        brand_map = {
-            "baker skateboards": "Baker",
-            "baker": "Baker",
-            "deathwish skateboards": "Deathwish",
-            "deathwish": "Deathwish",
-            "palace skateboards": "Palace",
-            "palace": "Palace",
-            "fa world entertainment": "FA",
-            "fa": "FA",
-            "hockey": "Hockey",
-            "real skateboards": "Real",
-            "real": "Real",
-            "anti hero": "Anti-Hero",
-            "antihero": "Anti-Hero",
-            "girl skateboards": "Girl",
-            "girl": "Girl",
-            "chocolate": "Chocolate",
-            "flip skateboards": "Flip",
-            "flip": "Flip",
-            "polar skate co": "Polar",
-            "polar": "Polar",
-            "alltimers": "Alltimers",
-            "quasi": "Quasi",
-            "fucking awesome": "FA",
-        }
-        return brand_map.get(v.lower().strip(), v.title())
-
-    class Config:
-        json_encoders = {Decimal: str, UUID: str, datetime: lambda v: v.isoformat()}
+        return sys.intern(_DECK_BRAND_MAP.get(v.lower().strip(), v.title()))
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "Deck":
+        """
+        Rebuild a Deck from already-canonical data (e.g. a DB or cache row).
+
+        Skips validation entirely via ``model_construct``, so only use this for
+        records that were validated before; scraper input goes through
+        ``model_validate``.
+        """
+        if "concave_type" in data:
+            # model_construct does no coercion, so enums must be members already
+            data = {**data, "concave_type": ConcaveType(data["concave_type"])}
+        return cls.model_construct(**data)
 
 
 class DeckPricing(BaseModel):
@@ -133,7 +177,7 @@ class DeckPricing(BaseModel):
     discount_percentage: Optional[Decimal] = None
     in_stock: bool = True
     stock_quantity: Optional[int] = None
-    last_updated: datetime = Field(default_factory=datetime.utcnow)
+    last_updated: datetime = Field(default_factory=_utcnow)
 
     @field_validator("discount_percentage", mode="before")
     @classmethod
@@ -145,5 +189,38 @@ class DeckPricing(BaseModel):
             msrp = values.data["msrp"]
             price = values.data["price"]
             if msrp > 0:
-                return ((msrp - price) / msrp * 100).quantize(Decimal("0.01"))
+                return _discount_off(price, msrp)
         return None
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Dict[str, Any]]) -> List["DeckPricing"]:
+        """
+        Build pricing for a trusted catalog batch without per-row validation.
+
+        Money fields are converted to Decimal as validation would. Rows with a
+        positive MSRP are picked out in one vectorized pass and get the same
+        exact Decimal discount as the validator; rows that already carry a
+        discount keep it.
+        """
+        # numpy is only needed for batch pricing, so import it on first use
+        from ._pricing import discount_rows
+
+        now = _utcnow()
+        batch = []
+        for row in rows:
+            row = {"last_updated": now, **row}
+            for name in ("price", "msrp", "discount_percentage"):
+                if row.get(name) is not None:
+                    row[name] = _to_decimal(row[name])
+            batch.append(row)
+
+        for i in discount_rows([row.get("msrp") for row in batch]):
+            row = batch[i]
+            if row.get("discount_percentage") is None:
+                row["discount_percentage"] = _discount_off(row["price"], row["msrp"])
+        return [cls.model_construct(**row) for row in batch]
+
+    @field_serializer("price", "msrp", "discount_percentage", when_used="json-unless-none")
+    def serialize_money(self, v: Decimal) -> str:
+        """Serialize money values as exact decimal strings."""
+        return str(v)
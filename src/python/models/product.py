@@ -1,17 +1,24 @@
 """
-CompleteProduct Model - Unified E-commerce Product
+Product Adapters - Shared Enums and Validation Entry Points
 
-Aggregates all skate product types into a unified e-commerce product model
-with pricing, availability, and retailer information.
+Shared product enums plus the prebuilt TypeAdapters for validating retailer
+data: per-category list adapters and ``validate_page`` for whole pages,
+``ProductUnion`` (dispatching on the ``category`` tag) with its page and item
+adapters for mixed pages, and single-item adapters per model.
 """
 
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Optional
+from typing import Annotated, Any, List, Optional, Union
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+
+from .bearing import Bearing
+from .deck import Deck
+from .truck import Truck
+from .wheel import Wheel
 
 
 class AvailabilityStatus(str, Enum):
@@ -48,3 +55,58 @@ class ProductCategory(str, Enum):
     WHEEL = "wheel"
     BEARING = "bearing"
     HARDWARE = "hardware"
+
+
+# Adapters for retailer list pages, built once at import rather than per
+# request. Use ``DECK_LIST.validate_json(body)`` on raw JSON so decoding and
+# validation happen in one pass, without an intermediate ``json.loads`` dict.
+DECK_LIST = TypeAdapter(List[Deck])
+TRUCK_LIST = TypeAdapter(List[Truck])
+WHEEL_LIST = TypeAdapter(List[Wheel])
+BEARING_LIST = TypeAdapter(List[Bearing])
+
+_LIST_ADAPTERS = {
+    ProductCategory.DECK: DECK_LIST,
+    ProductCategory.TRUCK: TRUCK_LIST,
+    ProductCategory.WHEEL: WHEEL_LIST,
+    ProductCategory.BEARING: BEARING_LIST,
+}
+
+
+def validate_page(
+    category: Optional[ProductCategory], page: Union[str, bytes, List[Any]]
+) -> List[Any]:
+    """
+    Validate a retailer page in one call.
+
+    ``page`` is either the raw JSON body or the already-decoded list of row
+    dicts. The whole list is validated by pydantic-core at once instead of
+    building models one by one in a Python loop. Pass ``category=None`` for
+    pages that mix product types (e.g. "new arrivals"); rows are then routed
+    by their ``category`` tag.
+    """
+    if category is None:
+        adapter = PAGE_ADAPTER
+    else:
+        category = ProductCategory(category)
+        if category not in _LIST_ADAPTERS:
+            raise ValueError(f"No product model for category {category.value!r}")
+        adapter = _LIST_ADAPTERS[category]
+    if isinstance(page, (str, bytes)):
+        return adapter.validate_json(page)
+    return adapter.validate_python(page)
+
+
+# Any single skate product. Validation dispatches on the ``category`` tag
+# instead of trying each model in turn.
+ProductUnion = Annotated[
+    Union[Deck, Truck, Wheel, Bearing], Field(discriminator="category")
+]
+PRODUCT_ADAPTER = TypeAdapter(ProductUnion)
+PAGE_ADAPTER = TypeAdapter(List[ProductUnion])
+
+# Single-item adapters, e.g. for detail pages or re-validating one row
+DECK_ADAPTER = TypeAdapter(Deck)
+TRUCK_ADAPTER = TypeAdapter(Truck)
+WHEEL_ADAPTER = TypeAdapter(Wheel)
+BEARING_ADAPTER = TypeAdapter(Bearing)
@@ -5,13 +5,27 @@ Represents skateboard truck specifications with focus on street skating
 preferences (Independent, Thunder, Venture).
 """
 
-from datetime import datetime
-from decimal import Decimal
-from enum import Enum
-from typing import Optional
+import sys
+from datetime import datetime, timezone
+from enum import Enum, IntFlag
+from types import MappingProxyType
+from typing import Any, Dict, Literal, Mapping, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    SerializerFunctionWrapHandler,
+    field_validator,
+    model_serializer,
+    model_validator,
+)
+
+
+def _utcnow() -> datetime:
+    """Timezone-aware UTC now, used as the timestamp default factory."""
+    return datetime.now(timezone.utc)
 
 
 class TruckGeometry(str, Enum):
@@ -22,6 +36,83 @@ class TruckGeometry(str, Enum):
     HIGH = "high"  # More turn, better for carving
 
 
+class TruckFlags(IntFlag):
+    """Boolean truck features packed into a single field."""
+
+    HOLLOW_LIGHT = 1  # Hollow axle and kingpin for weight savings
+    FORGED_BASEPLATE = 2  # Forged aluminum baseplate (lighter/stronger)
+    TITANIUM_AXLE = 4  # Titanium axle (premium lightweight)
+
+
+# Former bool fields -> their flag, still accepted as input
+_TRUCK_FLAG_FIELDS: Dict[str, TruckFlags] = {
+    "hollow_light": TruckFlags.HOLLOW_LIGHT,
+    "forged_baseplate": TruckFlags.FORGED_BASEPLATE,
+    "titanium_axle": TruckFlags.TITANIUM_AXLE,
+}
+
+
+def _fold_legacy_flags(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Fold the former bool fields (hollow_light=True, ...) into ``flags``."""
+    if _TRUCK_FLAG_FIELDS.keys().isdisjoint(data):
+        return data
+    data = dict(data)
+    flags = TruckFlags(data.get("flags", 0))
+    for name, flag in _TRUCK_FLAG_FIELDS.items():
+        if name in data:
+            flags = flags | flag if data.pop(name) else flags & ~flag
+    data["flags"] = flags
+    return data
+
+
+# Lowercased retailer spellings -> canonical brand name
+_TRUCK_BRAND_MAP: Dict[str, str] = {
+    "independent": "Independent",
+    "independent truck company": "Independent",
+    "indy": "Independent",
+    "thunder": "Thunder",
+    "thunder trucks": "Thunder",
+    "venture": "Venture",
+    "venture trucks": "Venture",
+    "ace": "Ace",
+    "ace trucks": "Ace",
+    "krux": "Krux",
+    "royal": "Royal",
+    "destructo": "Destructo",
+    "silver": "Silver",
+    "theeve": "Theeve",
+}
+
+
+# Lowercased size labels (spaces removed) -> standard size class
+_TRUCK_SIZE_MAP: Dict[str, str] = {
+    "129": "129mm",
+    "139": "139mm",
+    "144": "144mm",
+    "149": "149mm",
+    "159": "159mm",
+    "169": "169mm",
+    "215": "215mm",
+    "low": "129mm",
+    "mid": "139mm",
+    "high": "149mm",
+}
+
+
+# Standard size class -> recommended deck width (read-only)
+_TRUCK_DECK_COMPAT: Mapping[str, str] = MappingProxyType(
+    {
+        "129mm": '7.5" - 7.75"',
+        "139mm": '7.875" - 8.125"',
+        "144mm": '8.125" - 8.25"',
+        "149mm": '8.25" - 8.5"',
+        "159mm": '8.5" - 8.75"',
+        "169mm": '8.75" - 9.0"',
+        "215mm": '10.0"+',
+    }
+)
+
+
 class Truck(BaseModel):
     """
     Skateboard truck with street skating specifications.
@@ -33,9 +124,23 @@ class Truck(BaseModel):
     - Ace: Classic feel, surfy turn
     """
 
+    # Immutable once built, so instances are hashable (e.g. for catalog dedup)
+    # Validators are built eagerly at import, and model instances passed back
+    # in (e.g. into a list adapter) are reused without revalidation
+    model_config = ConfigDict(
+        frozen=True,
+        validate_assignment=False,
+        revalidate_instances="never",
+        defer_build=False,
+        extra="ignore",
+    )
+
     # Identity
     id: UUID = Field(default_factory=uuid4)
     sku: str = Field(..., description="Retailer-specific SKU")
+    category: Literal["truck"] = Field(
+        default="truck", description="Product type tag (ProductCategory value)"
+    )
 
     # Brand & Model
     brand: str = Field(
@@ -68,18 +173,13 @@ class Truck(BaseModel):
     geometry: TruckGeometry = Field(
         default=TruckGeometry.MID, description="Truck geometry/height"
     )
-    hollow_light: bool = Field(
-        default=False, description="Hollow axle and kingpin for weight savings"
-    )
-    forged_baseplate: bool = Field(
-        default=False, description="Forged aluminum baseplate (lighter/stronger)"
-    )
-    titanium_axle: bool = Field(
-        default=False, description="Titanium axle (premium lightweight)"
+    flags: TruckFlags = Field(
+        default=TruckFlags(0),
+        description="Hollow light / forged baseplate / titanium axle",
     )
 
     # Weight (important for street skaters)
-    weight_grams: Optional[Decimal] = Field(
+    weight_grams: Optional[float] = Field(
         None, ge=200, le=600, description="Single truck weight in grams"
     )
 
@@ -95,63 +195,75 @@ class Truck(BaseModel):
     color: Optional[str] = Field(None, description="Truck color/finish")
 
     # Metadata
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
+
+    @model_validator(mode="before")
+    @classmethod
+    def fold_legacy_flags(cls, data: Any) -> Any:
+        """Fold the former bool fields (hollow_light=True, ...) into ``flags``."""
+        if isinstance(data, dict):
+            return _fold_legacy_flags(data)
+        return data
+
+    @model_serializer(mode="wrap")
+    def dump_legacy_flags(
+        self, handler: SerializerFunctionWrapHandler
+    ) -> Dict[str, Any]:
+        """Also emit the former bool fields so the serialized shape is unchanged."""
+        data = handler(self)
+        if "flags" not in data:
+            return data
+        for name, flag in _TRUCK_FLAG_FIELDS.items():
+            data[name] = bool(self.flags & flag)
+        return data
 
     @field_validator("brand")
     @classmethod
     def canonicalize_brand(cls, v: str) -> str:
         """Normalize truck brand names."""
-        brand_map = {
-            "independent": "Independent",
-            "independent truck company": "Independent",
-            "indy": "Independent",
-            "thunder": "Thunder",
-            "thunder trucks": "Thunder",
-            "venture": "Venture",
-            "venture trucks": "Venture",
-            "ace": "Ace",
-            "ace trucks": "Ace",
-            "krux": "Krux",
-            "royal": "Royal",
-            "destructo": "Destructo",
-            "silver": "Silver",
-            "theeve": "Theeve",
-        }
-        return brand_map.get(v.lower().strip(), v.title())
+        return sys.intern(_TRUCK_BRAND_MAP.get(v.lower().strip(), v.title()))
 
     @field_validator("size_class")
     @classmethod
     def normalize_size(cls, v: str) -> str:
         """Normalize truck size to standard format."""
-        size_map = {
-            "129": "129mm",
-            "139": "139mm",
-            "144": "144mm",
-            "149": "149mm",
-            "159": "159mm",
-            "169": "169mm",
-            "215": "215mm",
-            "low": "129mm",
-            "mid": "139mm",
-            "high": "149mm",
-        }
         normalized = v.lower().strip().replace(" ", "")
-        return size_map.get(normalized, v)
+        return sys.intern(_TRUCK_SIZE_MAP.get(normalized, v))
+
+    @property
+    def hollow_light(self) -> bool:
+        """Hollow axle and kingpin for weight savings."""
+        return bool(self.flags & TruckFlags.HOLLOW_LIGHT)
+
+    @property
+    def forged_baseplate(self) -> bool:
+        """Forged aluminum baseplate (lighter/stronger)."""
+        return bool(self.flags & TruckFlags.FORGED_BASEPLATE)
+
+    @property
+    def titanium_axle(self) -> bool:
+        """Titanium axle (premium lightweight)."""
+        return bool(self.flags & TruckFlags.TITANIUM_AXLE)
 
     @property
     def deck_compatibility(self) -> str:
         """Return recommended deck width for this truck size."""
-        compatibility_map = {
-            "129mm": '7.5" - 7.75"',
-            "139mm": '7.875" - 8.125"',
-            "144mm": '8.125" - 8.25"',
-            "149mm": '8.25" - 8.5"',
-            "159mm": '8.5" - 8.75"',
-            "169mm": '8.75" - 9.0"',
-            "215mm": '10.0"+',
-        }
-        return compatibility_map.get(self.size_class, "Unknown")
-
-    class Config:
-        json_encoders = {Decimal: str, UUID: str, datetime: lambda v: v.isoformat()}
+        return _TRUCK_DECK_COMPAT.get(self.size_class, "Unknown")
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "Truck":
+        """
+        Rebuild a Truck from already-canonical data (e.g. a DB or cache row).
+
+        Skips validation entirely via ``model_construct``, so only use this for
+        records that were validated before; scraper input goes through
+        ``model_validate``.
+        """
+        data = _fold_legacy_flags(data)
+        if "geometry" in data:
+            # model_construct does no coercion, so enums must be members already
+            data = {**data, "geometry": TruckGeometry(data["geometry"])}
+        if "flags" in data:
+            data = {**data, "flags": TruckFlags(data["flags"])}
+        return cls.model_construct(**data)
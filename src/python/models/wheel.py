@@ -5,13 +5,25 @@ Represents skateboard wheel specifications with focus on street skating
 formulas and durometers (Spitfire Formula Four, Bones STF/SPF).
 """
 
-from datetime import datetime
-from decimal import Decimal
+import sys
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional
+from typing import Any, Dict, Literal, Mapping, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
+
+
+def _utcnow() -> datetime:
+    """Timezone-aware UTC now, used as the timestamp default factory."""
+    return datetime.now(timezone.utc)
 
 
 class WheelFormula(str, Enum):
@@ -41,6 +53,80 @@ class WheelFormula(str, Enum):
     STANDARD = "Standard"
     SOFT = "Soft Cruiser"
 
+    @classmethod
+    def _missing_(cls, value):
+        """Resolve aliases and case variants; unknown names map to STANDARD."""
+        if isinstance(value, str):
+            return _FORMULA_LOOKUP.get(value.lower().strip(), cls.STANDARD)
+        return None
+
+
+# Lowercased retailer spellings -> canonical brand name
+_WHEEL_BRAND_MAP: Dict[str, str] = {
+    "spitfire": "Spitfire",
+    "spitfire wheels": "Spitfire",
+    "bones": "Bones",
+    "bones wheels": "Bones",
+    "bones bearings": "Bones",
+    "oj": "OJ",
+    "oj wheels": "OJ",
+    "oj team": "OJ",
+    "sml": "SML",
+    "sml wheels": "SML",
+    "sml.": "SML",
+    "ricta": "Ricta",
+    "ricta wheels": "Ricta",
+    "wayward": "Wayward",
+    "wayward wheels": "Wayward",
+    "way wheels": "Wayward",
+    "pig": "Pig",
+    "pig wheels": "Pig",
+    "mob": "Mob",
+    "blank": "Blank",
+}
+
+
+# Lowercased formula/shape names and abbreviations -> WheelFormula
+_FORMULA_MAP: Dict[str, WheelFormula] = {
+    "formula four": WheelFormula.FORMULA_FOUR,
+    "f4": WheelFormula.FORMULA_FOUR,
+    "stf": WheelFormula.STF,
+    "street tech formula": WheelFormula.STF,
+    "spf": WheelFormula.SPF,
+    "skatepark formula": WheelFormula.SPF,
+    "atf": WheelFormula.ATF,
+    "all terrain": WheelFormula.ATF,
+    "conical": WheelFormula.CONICAL,
+    "conical full": WheelFormula.CONICAL_FULL,
+    "radial": WheelFormula.RADIAL,
+    "radial full": WheelFormula.RADIAL_FULL,
+    "lock-ins": WheelFormula.LOCK_INS,
+    "lockins": WheelFormula.LOCK_INS,
+    "tablets": WheelFormula.TABLETS,
+    "classic": WheelFormula.CLASSIC,
+    "og": WheelFormula.OG_CLASSIC,
+    "og classic": WheelFormula.OG_CLASSIC,
+}
+
+
+# Case-insensitive member values fused with the aliases, so _missing_
+# resolves any spelling with a single dict hit
+_FORMULA_LOOKUP: Dict[str, WheelFormula] = {
+    **{member.value.lower(): member for member in WheelFormula},
+    **_FORMULA_MAP,
+}
+
+
+# Labels for the precomputed riding_style / slide_rating codes
+_RIDING_STYLES = (
+    "Technical Street",
+    "All-Around Street",
+    "Street/Park Hybrid",
+    "Cruiser/Soft",
+    "General Skateboarding",
+)
+_SLIDE_RATINGS = ("Maximum Slide", "High Slide", "Medium Slide", "Grip")
+
 
 class Wheel(BaseModel):
     """
@@ -59,9 +145,28 @@ class Wheel(BaseModel):
     - 101a: Maximum slide, best for smooth spots
     """
 
+    # Immutable once built, so instances are hashable for catalog dedup.
+    # Derive changed copies with model_copy(update=...), which recomputes the
+    # label codes
+    # Validators are built eagerly at import, and model instances passed back
+    # in (e.g. into a list adapter) are reused without revalidation.
+    # When compiled with Cython (make models-compile) methods are cyfunctions,
+    # which pydantic would reject as non-annotated fields without ignored_types
+    model_config = ConfigDict(
+        frozen=True,
+        validate_assignment=False,
+        revalidate_instances="never",
+        defer_build=False,
+        extra="ignore",
+        ignored_types=(type(_utcnow),),
+    )
+
     # Identity
     id: UUID = Field(default_factory=uuid4)
     sku: str = Field(..., description="Retailer-specific SKU")
+    category: Literal["wheel"] = Field(
+        default="wheel", description="Product type tag (ProductCategory value)"
+    )
 
     # Brand
     brand: str = Field(
@@ -75,10 +180,10 @@ class Wheel(BaseModel):
     durometer_a: int = Field(
         ..., ge=78, le=104, description="Wheel hardness in Shore A (street: 99a-101a)"
     )
-    width_mm: Optional[Decimal] = Field(
+    width_mm: Optional[float] = Field(
         None, ge=20, le=40, description="Wheel width in mm"
     )
-    contact_patch_mm: Optional[Decimal] = Field(
+    contact_patch_mm: Optional[float] = Field(
         None, ge=15, le=30, description="Contact patch width (riding surface)"
     )
 
@@ -103,90 +208,77 @@ class Wheel(BaseModel):
     @property
     def riding_style(self) -> str:
         """Determine riding style based on wheel specs."""
-        if self.diameter_mm <= 52 and self.durometer_a >= 99:
-            return "Technical Street"
-        elif self.diameter_mm <= 54 and self.durometer_a >= 99:
-            return "All-Around Street"
-        elif self.diameter_mm >= 54 and self.durometer_a >= 99:
-            return "Street/Park Hybrid"
-        elif self.durometer_a < 90:
-            return "Cruiser/Soft"
-        else:
-            return "General Skateboarding"
+        return _RIDING_STYLES[self._riding_style_idx]
 
     @property
     def slide_rating(self) -> str:
         """Estimate slide characteristics."""
-        if self.durometer_a >= 101:
-            return "Maximum Slide"
-        elif self.durometer_a >= 99:
-            return "High Slide"
-        elif self.durometer_a >= 95:
-            return "Medium Slide"
-        else:
-            return "Grip"
+        return _SLIDE_RATINGS[self._slide_rating_idx]
 
     # Metadata
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
+
+    # Indexes into _RIDING_STYLES / _SLIDE_RATINGS, set by precompute_labels
+    _riding_style_idx: int = PrivateAttr(default=4)
+    _slide_rating_idx: int = PrivateAttr(default=3)
 
     @field_validator("brand")
     @classmethod
     def canonicalize_brand(cls, v: str) -> str:
         """Normalize wheel brand names."""
-        brand_map = {
-            "spitfire": "Spitfire",
-            "spitfire wheels": "Spitfire",
-            "bones": "Bones",
-            "bones wheels": "Bones",
-            "bones bearings": "Bones",
-            "oj": "OJ",
-            "oj wheels": "OJ",
-            "oj team": "OJ",
-            "sml": "SML",
-            "sml wheels": "SML",
-            "sml.": "SML",
-            "ricta": "Ricta",
-            "ricta wheels": "Ricta",
-            "wayward": "Wayward",
-            "wayward wheels": "Wayward",
-            "way wheels": "Wayward",
-            "pig": "Pig",
-            "pig wheels": "Pig",
-            "mob": "Mob",
-            "blank": "Blank",
-        }
-        return brand_map.get(v.lower().strip(), v.title())
-
-    @field_validator("formula", mode="before")
+        return sys.intern(_WHEEL_BRAND_MAP.get(v.lower().strip(), v.title()))
+
+    @model_validator(mode="after")
+    def precompute_labels(self) -> "Wheel":
+        """Resolve the derived label codes once, after field validation."""
+        self._set_label_codes()
+        return self
+
+    def _set_label_codes(self) -> None:
+        """Compute the riding style and slide rating codes from the current fields."""
+        diameter, durometer = self.diameter_mm, self.durometer_a
+        if diameter <= 52 and durometer >= 99:
+            self._riding_style_idx = 0
+        elif diameter <= 54 and durometer >= 99:
+            self._riding_style_idx = 1
+        elif diameter >= 54 and durometer >= 99:
+            self._riding_style_idx = 2
+        elif durometer < 90:
+            self._riding_style_idx = 3
+        else:
+            self._riding_style_idx = 4
+
+        if durometer >= 101:
+            self._slide_rating_idx = 0
+        elif durometer >= 99:
+            self._slide_rating_idx = 1
+        elif durometer >= 95:
+            self._slide_rating_idx = 2
+        else:
+            self._slide_rating_idx = 3
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> "Wheel":
+        """Copy the model, recomputing the label codes when ``update`` is given."""
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            copy._set_label_codes()
+        return copy
+
     @classmethod
-    def normalize_formula(cls, v):
-        """Normalize formula names."""
-        if isinstance(v, WheelFormula):
-            return v
-        formula_map = {
-            "formula four": WheelFormula.FORMULA_FOUR,
-            "f4": WheelFormula.FORMULA_FOUR,
-            "stf": WheelFormula.STF,
-            "street tech formula": WheelFormula.STF,
-            "spf": WheelFormula.SPF,
-            "skatepark formula": WheelFormula.SPF,
-            "atf": WheelFormula.ATF,
-            "all terrain": WheelFormula.ATF,
-            "conical": WheelFormula.CONICAL,
-            "conical full": WheelFormula.CONICAL_FULL,
-            "radial": WheelFormula.RADIAL,
-            "radial full": WheelFormula.RADIAL_FULL,
-            "lock-ins": WheelFormula.LOCK_INS,
-            "lockins": WheelFormula.LOCK_INS,
-            "tablets": WheelFormula.TABLETS,
-            "classic": WheelFormula.CLASSIC,
-            "og": WheelFormula.OG_CLASSIC,
-            "og classic": WheelFormula.OG_CLASSIC,
-        }
-        if isinstance(v, str):
-            return formula_map.get(v.lower().strip(), WheelFormula.STANDARD)
-        return v
-
-    class Config:
-        json_encoders = {Decimal: str, UUID: str, datetime: lambda v: v.isoformat()}
+    def from_trusted(cls, data: Dict[str, Any]) -> "Wheel":
+        """
+        Rebuild a Wheel from already-canonical data (e.g. a DB or cache row).
+
+        Skips validation entirely via ``model_construct``, so only use this for
+        records that were validated before; scraper input goes through
+        ``model_validate``.
+        """
+        if "formula" in data:
+            # model_construct does no coercion, so enums must be members already
+            data = {**data, "formula": WheelFormula(data["formula"])}
+        wheel = cls.model_construct(**data)
+        wheel._set_label_codes()
+        return wheel
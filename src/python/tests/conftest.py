@@ -0,0 +1,6 @@
+"""Put src/python on sys.path so tests import ``models`` the way the app does."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
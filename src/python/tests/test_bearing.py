@@ -0,0 +1,49 @@
+"""Tests for the Bearing model."""
+
+from models.bearing import Bearing, BearingFlags, ShieldType
+
+
+def test_model_copy_update_recomputes_quality_tier():
+    reds = Bearing(sku="B-1", brand="bones", model="reds")
+    assert reds.quality_tier == "Mid-Range"
+
+    swiss = reds.model_copy(update={"model": "Swiss"})
+    assert swiss.quality_tier == "Premium"
+    assert reds.quality_tier == "Mid-Range"
+
+
+def test_model_copy_update_recomputes_maintenance_ease():
+    bearing = Bearing(sku="B-2", brand="bronson", model="g3")
+    assert bearing.maintenance_ease == "Easy (removable shields)"
+
+    metal = bearing.model_copy(update={"shield_type": ShieldType.METAL_SHIELD})
+    assert metal.maintenance_ease == "Moderate (metal shields)"
+
+
+def test_model_copy_without_update_keeps_labels():
+    bearing = Bearing(sku="B-3", brand="bones", model="super reds")
+    assert bearing.model_copy().quality_tier == "High-End"
+
+
+def test_from_trusted_folds_legacy_flag_keys():
+    bearing = Bearing.from_trusted(
+        {"sku": "B-4", "brand": "Bones", "model": "Reds", "ceramic": True}
+    )
+    assert bearing.flags == BearingFlags.CERAMIC | BearingFlags.REMOVABLE_SHIELDS
+    assert bearing.ceramic
+    assert bearing.quality_tier == "Premium"
+
+
+def test_dump_keeps_legacy_flag_keys():
+    bearing = Bearing(
+        sku="B-5",
+        brand="bones",
+        model="reds",
+        skate_rated=True,
+        removable_shields=False,
+    )
+    data = bearing.model_dump()
+    assert data["flags"] == BearingFlags.SKATE_RATED
+    assert data["skate_rated"] is True
+    assert data["removable_shields"] is False
+    assert Bearing.model_validate_json(bearing.model_dump_json()).flags == bearing.flags
@@ -0,0 +1,36 @@
+"""Tests for BulkCtx bulk construction."""
+
+from uuid import RFC_4122, UUID
+
+import pytest
+
+from models._bulk import BulkCtx
+from models.bearing import Bearing
+
+ROW = {"sku": "B-1", "brand": "Bones", "model": "Reds"}
+
+
+def test_uuids_are_unique_valid_uuid4s():
+    ctx = BulkCtx(256)
+    assert len(set(ctx.uuids)) == 256
+    assert all(u.version == 4 and u.variant == RFC_4122 for u in ctx.uuids)
+
+
+def test_build_assigns_ids_and_shared_timestamp():
+    ctx = BulkCtx(3)
+    bearings = ctx.build(Bearing, [ROW, ROW])
+    assert [b.id for b in bearings] == ctx.uuids[:2]
+    assert {b.created_at for b in bearings} == {ctx.now}
+    assert {b.updated_at for b in bearings} == {ctx.now}
+    assert bearings[0].quality_tier == "Mid-Range"
+
+
+def test_build_keeps_row_ids():
+    own_id = UUID(int=1)
+    (bearing,) = BulkCtx(1).build(Bearing, [{**ROW, "id": own_id}])
+    assert bearing.id == own_id
+
+
+def test_build_rejects_more_rows_than_allocated():
+    with pytest.raises(ValueError):
+        BulkCtx(1).build(Bearing, [ROW, ROW])
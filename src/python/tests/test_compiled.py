@@ -0,0 +1,56 @@
+"""Smoke test for ``make models-compile``: the Cython-built models still import."""
+
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("Cython")
+
+MODELS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models"
+)
+COMPILED_MODULES = ("bearing", "deck", "truck", "wheel")
+
+SMOKE = """
+import importlib.machinery
+
+import models.bearing, models.deck, models.truck, models.wheel
+from models.bearing import Bearing, ShieldType
+from models.wheel import Wheel
+
+suffixes = tuple(importlib.machinery.EXTENSION_SUFFIXES)
+for module in (models.bearing, models.deck, models.truck, models.wheel):
+    assert module.__file__.endswith(suffixes), module.__file__
+
+bearing = Bearing(sku="B-1", brand="bones", model="reds")
+metal = bearing.model_copy(update={"shield_type": ShieldType.METAL_SHIELD})
+assert metal.maintenance_ease == "Moderate (metal shields)"
+wheel = Wheel(sku="W-1", brand="spitfire", diameter_mm=52, durometer_a=99)
+assert wheel.model_copy(update={"durometer_a": 83}).slide_rating == "Grip"
+"""
+
+
+def test_compiled_models_import(tmp_path):
+    if shutil.which("cc") is None and shutil.which("gcc") is None:
+        pytest.skip("no C compiler")
+    package = tmp_path / "models"
+    shutil.copytree(
+        MODELS_DIR, package, ignore=shutil.ignore_patterns("__pycache__", "*.c", "*.so")
+    )
+    sources = [str(package / f"{name}.py") for name in COMPILED_MODULES]
+    subprocess.run(
+        [sys.executable, "-m", "Cython.Build.Cythonize", "-i", "-3", *sources],
+        cwd=tmp_path,
+        check=True,
+        capture_output=True,
+    )
+    for name in COMPILED_MODULES:
+        os.remove(package / f"{name}.py")
+
+    result = subprocess.run(
+        [sys.executable, "-c", SMOKE], cwd=tmp_path, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,54 @@
+"""Tests for vectorized deck pricing."""
+
+from decimal import Decimal
+from uuid import uuid4
+
+from models._pricing import discount_rows
+from models.deck import DeckPricing
+
+
+def _row(**fields):
+    return {"deck_id": uuid4(), "retailer": "tactics", **fields}
+
+
+def test_discount_rows_picks_positive_msrp():
+    rows = discount_rows([Decimal("100"), None, 0, float("nan"), Decimal("64.99")])
+    assert rows.tolist() == [0, 4]
+
+
+def test_from_rows_fills_missing_discounts():
+    price = Decimal("59.99")
+    rows = [_row(price=price, msrp=Decimal("64.99")), _row(price=price)]
+    batch = DeckPricing.from_rows(rows)
+    assert batch[0].discount_percentage == Decimal("7.69")
+    assert batch[1].discount_percentage is None
+
+
+def test_from_rows_rounds_like_validation():
+    # float64 math lands on 5.37 here; the exact value rounds to 5.38
+    (pricing,) = DeckPricing.from_rows([_row(price=Decimal("7.57"), msrp=Decimal("8"))])
+    validated = DeckPricing(
+        **_row(price=Decimal("7.57"), msrp=Decimal("8"), discount_percentage=None)
+    )
+    assert pricing.discount_percentage == Decimal("5.38")
+    assert pricing.discount_percentage == validated.discount_percentage
+
+
+def test_from_rows_converts_money_to_decimal():
+    row = _row(price="1.005", msrp=2, discount_percentage=1.5)
+    (pricing,) = DeckPricing.from_rows([row])
+    assert pricing.price == Decimal("1.005")
+    assert pricing.msrp == Decimal("2")
+    assert pricing.discount_percentage == Decimal("1.5")
+    assert all(
+        isinstance(v, Decimal)
+        for v in (pricing.price, pricing.msrp, pricing.discount_percentage)
+    )
+
+
+def test_from_rows_keeps_given_discount():
+    row = _row(
+        price=Decimal("50"), msrp=Decimal("100"), discount_percentage=Decimal("10.00")
+    )
+    (pricing,) = DeckPricing.from_rows([row])
+    assert pricing.discount_percentage == Decimal("10.00")
@@ -0,0 +1,69 @@
+"""Tests for the page-level validation helpers in models.product."""
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from models.deck import Deck
+from models.product import (
+    DECK_ADAPTER,
+    PAGE_ADAPTER,
+    ProductCategory,
+    validate_page,
+)
+from models.wheel import Wheel
+
+DECK_ROW = {"sku": "D-1", "brand": "baker", "width_inches": 8.25, "length_inches": 31.5}
+WHEEL_ROW = {"sku": "W-1", "brand": "spitfire", "diameter_mm": 52, "durometer_a": 99}
+
+
+def test_validate_page_single_category():
+    decks = validate_page(ProductCategory.DECK, [DECK_ROW, {**DECK_ROW, "sku": "D-2"}])
+    assert [type(d) for d in decks] == [Deck, Deck]
+    assert decks[0].brand == "Baker"
+
+
+def test_validate_page_accepts_raw_json_and_category_value():
+    body = json.dumps([WHEEL_ROW]).encode()
+    (wheel,) = validate_page("wheel", body)
+    assert isinstance(wheel, Wheel)
+    assert wheel.riding_style == "Technical Street"
+
+
+def test_validate_page_rejects_bad_rows():
+    with pytest.raises(ValidationError):
+        validate_page(ProductCategory.DECK, [{**DECK_ROW, "width_inches": 12}])
+
+
+def test_validate_page_category_without_model():
+    with pytest.raises(ValueError, match="hardware"):
+        validate_page(ProductCategory.HARDWARE, [])
+
+
+def test_validate_page_mixed_categories():
+    page = [
+        {**DECK_ROW, "category": "deck"},
+        {**WHEEL_ROW, "category": "wheel"},
+        {"sku": "T-1", "brand": "indy", "size_class": "149", "category": "truck"},
+        {"sku": "B-1", "brand": "bones", "model": "reds", "category": "bearing"},
+    ]
+    products = validate_page(None, json.dumps(page))
+    assert [p.category for p in products] == ["deck", "wheel", "truck", "bearing"]
+    assert [type(p) for p in PAGE_ADAPTER.validate_python(page)] == [
+        type(p) for p in products
+    ]
+    assert products[2].deck_compatibility == '8.25" - 8.5"'
+
+
+def test_mixed_page_requires_known_category_tag():
+    with pytest.raises(ValidationError):
+        PAGE_ADAPTER.validate_python([DECK_ROW])
+    with pytest.raises(ValidationError):
+        PAGE_ADAPTER.validate_python([{**DECK_ROW, "category": "hardware"}])
+
+
+def test_single_item_adapter():
+    deck = DECK_ADAPTER.validate_python(DECK_ROW)
+    assert isinstance(deck, Deck)
+    assert DECK_ADAPTER.validate_python(deck) is deck
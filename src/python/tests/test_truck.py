@@ -0,0 +1,25 @@
+"""Tests for the Truck model."""
+
+from models.truck import Truck, TruckFlags
+
+
+def test_from_trusted_folds_legacy_flag_keys():
+    truck = Truck.from_trusted(
+        {
+            "sku": "T-1",
+            "brand": "Independent",
+            "size_class": "144mm",
+            "hollow_light": True,
+        }
+    )
+    assert truck.flags == TruckFlags.HOLLOW_LIGHT
+    assert truck.hollow_light
+
+
+def test_dump_keeps_legacy_flag_keys():
+    truck = Truck(sku="T-2", brand="indy", size_class="149", titanium_axle=True)
+    data = truck.model_dump()
+    assert data["flags"] == TruckFlags.TITANIUM_AXLE
+    assert data["titanium_axle"] is True
+    assert data["hollow_light"] is False
+    assert Truck.model_validate_json(truck.model_dump_json()).flags == truck.flags
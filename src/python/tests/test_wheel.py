@@ -0,0 +1,21 @@
+"""Tests for the Wheel model."""
+
+from models.wheel import Wheel
+
+
+def test_model_copy_update_recomputes_labels():
+    wheel = Wheel(sku="W-1", brand="spitfire", diameter_mm=52, durometer_a=99)
+    assert wheel.riding_style == "Technical Street"
+    assert wheel.slide_rating == "High Slide"
+
+    soft = wheel.model_copy(update={"durometer_a": 83})
+    assert soft.riding_style == "Cruiser/Soft"
+    assert soft.slide_rating == "Grip"
+    assert wheel.slide_rating == "High Slide"
+
+
+def test_model_copy_without_update_keeps_labels():
+    wheel = Wheel(sku="W-2", brand="bones", diameter_mm=56, durometer_a=101)
+    copy = wheel.model_copy()
+    assert copy.riding_style == "Street/Park Hybrid"
+    assert copy.slide_rating == "Maximum Slide"